@@ -8,10 +8,33 @@ Consideraciones:
 """ 
 
 import random
-from copy import deepcopy
 import auxiliar as aux
 import cuerpoFq as Fq
 
+# Longitud mínima de los factores a partir de la cual mult usa Karatsuba
+UMBRAL_KARATSUBA = 16
+
+# Grado mínimo del divisor y del cociente a partir del cual div usa 
+# la iteración de Newton
+UMBRAL_NEWTON = 256
+
+# Inversos de los divisores invertidos como series de potencias,
+# indexados por (p, f, h), y número máximo de ellos que se guardan
+_inversos_serie = {}
+MAX_INVERSOS_SERIE = 64
+
+# Grado a partir del cual hgcd se aplica de forma recursiva
+UMBRAL_HGCD = 32
+
+# Longitud mínima del polinomio y del número de puntos a partir de la 
+# cual evalua_multi usa el árbol de subproductos
+UMBRAL_ARBOL = 256
+
+# Árboles de subproductos ya construidos, indexados por (p, f, puntos),
+# y número máximo de ellos que se guardan
+_arboles = {}
+MAX_ARBOLES = 16
+
 def neutro_ad(p, f):
     """
 
@@ -118,13 +141,111 @@ def mult(g, h, p, f):
         PRODUCTO DE LOS ELEMENTOS g Y h EN ((Z/pZ)[x]/<f>)[x]
 
     """
-    deg = (len(g)-1)+(len(h)-1)
-    m = [neutro_ad(p, f)]*(deg+1)
-    for i in range(0, len(g)):
-        for j in range(0, len(h)):
-            m[i+j] = Fq.suma(Fq.mult(g[i], h[j], p, f), m[i+j], p, f)
-    return reduce(m, p, f) 
+    return reduce(_karatsuba(g, h, p, f), p, f)
                         
+def _karatsuba(g, h, p, f):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    m : LISTA
+        COEFICIENTES DEL PRODUCTO g*h EN ((Z/pZ)[x]/<f>)[x], SIN REDUCIR,
+        CON LONGITUD len(g)+len(h)-1
+
+    """
+    if min(len(g), len(h)) < UMBRAL_KARATSUBA:
+        return _mult_escolar(g, h, p, f)
+    k = max(len(g), len(h))//2
+    m = [Fq.neutro_ad(p, f)]*(len(g)+len(h)-1)
+    if len(g) <= k or len(h) <= k:
+        # Factores desequilibrados: partimos solo el más largo
+        if len(h) > len(g):
+            g, h = h, g
+        partes = [(0, _karatsuba(g[:k], h, p, f)), \
+        (k, _karatsuba(g[k:], h, p, f))]
+    else:
+        g0, g1 = g[:k], g[k:]
+        h0, h1 = h[:k], h[k:]
+        z0 = _karatsuba(g0, h0, p, f)
+        z2 = _karatsuba(g1, h1, p, f)
+        z1 = _karatsuba(_suma_coefs(g0, g1, p, f), \
+        _suma_coefs(h0, h1, p, f), p, f)
+        z1 = _suma_coefs(z1, \
+        [Fq.inv_ad(c, p, f) for c in _suma_coefs(z0, z2, p, f)], p, f)
+        partes = [(0, z0), (k, z1), (2*k, z2)]
+    for desp, z in partes:
+        for i in range(0, min(len(z), len(m)-desp)):
+            m[desp+i] = Fq.suma(m[desp+i], z[i], p, f)
+    return m
+
+def _mult_escolar(g, h, p, f):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    m : LISTA
+        COEFICIENTES DEL PRODUCTO g*h EN ((Z/pZ)[x]/<f>)[x] CALCULADOS
+        CON EL ALGORITMO ESCOLAR, SIN REDUCIR, CON LONGITUD len(g)+len(h)-1
+
+    """
+    if len(g) == 0 or len(h) == 0:
+        return []
+    m = [Fq.neutro_ad(p, f)]*(len(g)+len(h)-1)
+    for i in range(0, len(g)):
+        if g[i] != Fq.neutro_ad(p, f):
+            for j in range(0, len(h)):
+                m[i+j] = Fq.suma(Fq.mult(g[i], h[j], p, f), m[i+j], p, f)
+    return m
+
+def _suma_coefs(g, h, p, f):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    s : LISTA
+        COEFICIENTES DE g+h EN ((Z/pZ)[x]/<f>)[x], SIN REDUCIR
+
+    """
+    if len(g) < len(h):
+        g, h = h, g
+    s = list(g)
+    for i in range(0, len(h)):
+        s[i] = Fq.suma(s[i], h[i], p, f)
+    return s
+
 def div(g, h, p, f):
     """
 
@@ -151,25 +272,121 @@ def div(g, h, p, f):
     """
     if h == neutro_ad(p, f):
         raise Exception("No se puede dividir por cero")
+    elif len(h)-1 >= UMBRAL_NEWTON and len(g)-len(h)+1 >= UMBRAL_NEWTON:
+        return _div_newton(g, h, p, f)
     else:
-        grado_pol1 = len(g)-1
         grado_pol2 = len(h)-1
-        pol1 = deepcopy(g)
-        cociente = [Fq.neutro_ad(p, f)]*(grado_pol1-grado_pol2+1)
-        while grado_pol1 >= grado_pol2 and pol1 != neutro_ad(p, f):
-            pol2 = deepcopy(h)
-            a = pol1[len(pol1)-1]
-            b = pol2[len(pol2)-1]
-            c = Fq.mult(a, Fq.inv_mult(b, p, f), p, f)
-            dif = grado_pol1 - grado_pol2
-            cociente[dif] = c
-            for i in range(0, len(pol2)):
-                pol2[i] = Fq.mult(Fq.inv_ad(c, p, f), pol2[i], p, f)
-            pol2 = [Fq.neutro_ad(p, f)]*dif + pol2
-            pol1 = suma(pol1, pol2, p, f)
-            grado_pol1 = len(pol1)-1
-        resto = pol1
-        return cociente, resto
+        resto = list(g)
+        cociente = [Fq.neutro_ad(p, f) for i in range(len(g)-grado_pol2)]
+        # Si h es mónico no hace falta invertir su coeficiente principal
+        b = h[grado_pol2]
+        monico = b == Fq.neutro_mult(p, f)
+        if not monico:
+            inv = Fq.inv_mult(b, p, f)
+        for i in range(len(resto)-1, grado_pol2-1, -1):
+            c = resto[i] if monico else Fq.mult(resto[i], inv, p, f)
+            if c != Fq.neutro_ad(p, f):
+                dif = i - grado_pol2
+                cociente[dif] = c
+                menos_c = Fq.inv_ad(c, p, f)
+                for j in range(0, grado_pol2):
+                    resto[dif+j] = \
+                    Fq.suma(resto[dif+j], Fq.mult(menos_c, h[j], p, f), p, f)
+        return cociente, reduce(resto[:grado_pol2], p, f)
+
+def inverso_serie(h, m, p, f):
+    """
+
+    Parámetros
+    ----------
+    h : LISTA
+        POLINOMIO NO NULO
+    m : ENTERO
+        PRECISIÓN DE LA SERIE
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    inv : LISTA
+        INVERSO DEL POLINOMIO INVERTIDO x^deg(h)*h(1/x) MÓDULO x^m EN 
+        ((Z/pZ)[x]/<f>)[x], DE LONGITUD m, CALCULADO CON LA ITERACIÓN 
+        DE NEWTON. SE GUARDA PARA REUTILIZARLO EN DIVISIONES POR EL MISMO h
+
+    """
+    clave = (p, tuple(f), tuple(tuple(c) for c in h))
+    rev = h[::-1]
+    if clave in _inversos_serie:
+        inv = _inversos_serie[clave]
+    else:
+        inv = [Fq.inv_mult(rev[0], p, f)]
+    if len(inv) < m:
+        dos = Fq.suma(Fq.neutro_mult(p, f), Fq.neutro_mult(p, f), p, f)
+        while len(inv) < m:
+            k = min(2*len(inv), m)
+            # inv = inv*(2 - rev*inv) mód x^k
+            e = _trunca(inv_ad(mult(rev[:k], inv, p, f), p, f), k, p, f)
+            e[0] = Fq.suma(e[0], dos, p, f)
+            inv = _trunca(mult(inv, e, p, f), k, p, f)
+        if len(_inversos_serie) >= MAX_INVERSOS_SERIE:
+            del _inversos_serie[next(iter(_inversos_serie))]
+        _inversos_serie[clave] = inv
+    return inv[:m]
+
+def _div_newton(g, h, p, f):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO NO NULO, deg(h) <= deg(g)
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    cociente : LISTA
+    resto : LISTA
+        COCIENTE Y RESTO DE LA DIVISIÓN DE g ENTRE h EN 
+        ((Z/pZ)[x]/<f>)[x], CALCULADOS CON DOS PRODUCTOS A PARTIR 
+        DEL INVERSO EN SERIE DE h INVERTIDO
+
+    """
+    k = len(g)-len(h)+1
+    inv = inverso_serie(h, k, p, f)
+    cociente = _trunca(mult(g[::-1][:k], inv, p, f), k, p, f)[::-1]
+    qh = _trunca(mult(cociente, h, p, f), len(h)-1, p, f)
+    resto = [Fq.suma(g[i], Fq.inv_ad(qh[i], p, f), p, f) \
+    for i in range(0, len(h)-1)]
+    return cociente, reduce(resto, p, f)
+
+def _trunca(g, k, p, f):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    k : ENTERO
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    LISTA
+        LOS k PRIMEROS COEFICIENTES DE g (g MÓDULO x^k), 
+        COMPLETADOS CON CEROS HASTA LONGITUD k
+
+    """
+    return g[:k] + [Fq.neutro_ad(p, f) for i in range(k-len(g))]
 
 def gcd(g, h, p, f):
     """
@@ -237,6 +454,189 @@ def gcd_ext(g, h, p, f):
     s = mult(inv, s0, p, f)
     return gcd, r, s
 
+def gcd_ext_parcial(g, h, d, p, f):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO
+    d : ENTERO
+        GRADO EN EL QUE SE DETIENE EL ALGORITMO DE EUCLIDES
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    u : LISTA
+        PRIMER RESTO DE LA SUCESIÓN DE EUCLIDES DE g Y h 
+        (EMPEZANDO EN h) CON GRADO MENOR O IGUAL QUE d
+    r : LISTA
+    s : LISTA
+        POLINOMIOS TALES QUE u = g*r + h*s
+
+    Se calcula con el algoritmo half-gcd, sin normalizar los restos
+
+    """
+    M = _matriz_identidad(p, f)
+    a, b = g, h
+    while len(b)-1 > d:
+        n = len(a)-1
+        R = None
+        if n > len(b)-1 and n-d > UMBRAL_HGCD:
+            k = max(0, 2*(d+1)-n)
+            R = hgcd(a[k:], b[k:], p, f)
+            if R == _matriz_identidad(p, f):
+                R = None
+        if R is None:
+            R = _paso_euclides(_matriz_identidad(p, f), \
+            div(a, b, p, f)[0], p, f)
+        a, b = _aplica_matriz(R, a, b, p, f)
+        M = _mult_matrices(R, M, p, f)
+    return b, M[2], M[3]
+
+def hgcd(g, h, p, f):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO, deg(h) < deg(g)
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    M : TUPLA
+        MATRIZ (m00, m01, m10, m11) DE POLINOMIOS TAL QUE 
+        (c, d) = (m00*g + m01*h, m10*g + m11*h) SON DOS RESTOS 
+        CONSECUTIVOS DE LA SUCESIÓN DE EUCLIDES DE g Y h CON 
+        deg(c) >= m > deg(d), SIENDO m = ceil(deg(g)/2)
+
+    """
+    m = len(g)//2
+    if len(h)-1 < m:
+        return _matriz_identidad(p, f)
+    if len(g)-1 < UMBRAL_HGCD:
+        M = _matriz_identidad(p, f)
+        while len(h)-1 >= m:
+            cociente, resto = div(g, h, p, f)
+            M = _paso_euclides(M, cociente, p, f)
+            g, h = h, resto
+        return M
+    R = hgcd(g[m:], h[m:], p, f)
+    c, d = _aplica_matriz(R, g, h, p, f)
+    if len(d)-1 < m:
+        return R
+    cociente, resto = div(c, d, p, f)
+    R = _paso_euclides(R, cociente, p, f)
+    c, d = d, resto
+    if len(d)-1 < m:
+        return R
+    k = 2*m-(len(c)-1)
+    S = hgcd(c[k:], d[k:], p, f)
+    return _mult_matrices(S, R, p, f)
+
+def _matriz_identidad(p, f):
+    """
+
+    Parámetros
+    ----------
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    TUPLA
+        MATRIZ IDENTIDAD 2x2 CON COEFICIENTES EN ((Z/pZ)[x]/<f>)[x]
+
+    """
+    return (neutro_mult(p, f), neutro_ad(p, f), neutro_ad(p, f), neutro_mult(p, f))
+
+def _paso_euclides(M, cociente, p, f):
+    """
+
+    Parámetros
+    ----------
+    M : TUPLA
+        MATRIZ 2x2 CON COEFICIENTES EN ((Z/pZ)[x]/<f>)[x]
+    cociente : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    TUPLA
+        PRODUCTO DE LA MATRIZ (0, 1, 1, -cociente) POR M
+
+    """
+    return (M[2], M[3], \
+    suma(M[0], inv_ad(mult(cociente, M[2], p, f), p, f), p, f), \
+    suma(M[1], inv_ad(mult(cociente, M[3], p, f), p, f), p, f))
+
+def _mult_matrices(M, N, p, f):
+    """
+
+    Parámetros
+    ----------
+    M : TUPLA
+        MATRIZ 2x2 CON COEFICIENTES EN ((Z/pZ)[x]/<f>)[x]
+    N : TUPLA
+        MATRIZ 2x2 CON COEFICIENTES EN ((Z/pZ)[x]/<f>)[x]
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    TUPLA
+        PRODUCTO DE LAS MATRICES M Y N
+
+    """
+    return (suma(mult(M[0], N[0], p, f), mult(M[1], N[2], p, f), p, f), \
+    suma(mult(M[0], N[1], p, f), mult(M[1], N[3], p, f), p, f), \
+    suma(mult(M[2], N[0], p, f), mult(M[3], N[2], p, f), p, f), \
+    suma(mult(M[2], N[1], p, f), mult(M[3], N[3], p, f), p, f))
+
+def _aplica_matriz(M, g, h, p, f):
+    """
+
+    Parámetros
+    ----------
+    M : TUPLA
+        MATRIZ 2x2 CON COEFICIENTES EN ((Z/pZ)[x]/<f>)[x]
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    TUPLA
+        POLINOMIOS (m00*g + m01*h, m10*g + m11*h)
+
+    """
+    return (suma(mult(M[0], g, p, f), mult(M[1], h, p, f), p, f), \
+    suma(mult(M[2], g, p, f), mult(M[3], h, p, f), p, f))
+
 def reduce(g, p, f):
     """
 
@@ -256,14 +656,9 @@ def reduce(g, p, f):
         CON ÚNICAMENTE LOS COEFICIENTES NECESARIOS
 
     """
-    if g == neutro_ad(p, f):
-        return g
-    else:
-        if (g[len(g)-1] == Fq.neutro_ad(p, f)):
-            g.pop(len(g)-1)
-            return reduce(g, p, f)
-        else:
-            return g
+    while len(g) > 0 and g[len(g)-1] == Fq.neutro_ad(p, f):
+        g.pop(len(g)-1)
+    return g
 
 def interpola_lagrange(k, a, b, p, f):
     """
@@ -288,20 +683,142 @@ def interpola_lagrange(k, a, b, p, f):
         DE LOS PUNTOS {(a_i, b_i)}_{i}
 
     """
+    difs = []
+    for i in range(0, k):
+        for j in range(0, k):
+            if j != i:
+                difs.append(Fq.suma(a[i], Fq.inv_ad(a[j], p, f), p, f))
+    invs = Fq.inv_mult_batch(difs, p, f)
     g = neutro_ad(p, f)
+    pos = 0
     for i in range(0, k):
         L_i = neutro_mult(p, f)
         for j in range(0, k):
             if j != i:
-                p1 = \
-                Fq.inv_mult(Fq.suma(a[i], \
-                Fq.inv_ad(a[j], p, f), p, f), p, f)
+                p1 = invs[pos]
+                pos += 1
                 p0 = Fq.mult(Fq.inv_ad(a[j], p, f), p1, p, f)
                 pol = [p0, p1]
                 L_i = mult(L_i, pol, p, f)
         g = suma(g, mult([b[i]], L_i, p, f), p, f)
     return g
 
+def interpola(a, b, p, f):
+    """
+
+    Parámetros
+    ----------
+    a : LISTA
+        CONTIENE LAS PRIMERAS COORDENADAS 
+        DE LOS PUNTOS DE INTERPOLACIÓN
+    b : LISTA
+        CONTIENE LAS SEGUNDAS COORDENADAS 
+        DE LOS PUNTOS DE INTERPOLACIÓN
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    g : LISTA
+        POLINOMIO DE INTERPOLACIÓN DE LAGRANGE DE LOS PUNTOS 
+        {(a_i, b_i)}_{i}, CALCULADO SOBRE EL ÁRBOL DE SUBPRODUCTOS 
+        DE a CON LOS PESOS b_i/w'(a_i), SIENDO w EL PRODUCTO DE 
+        TODOS LOS (x-a_i)
+
+    """
+    if len(a) == 0:
+        return neutro_ad(p, f)
+    arbol = arbol_subproductos(a, p, f)
+    w = arbol[len(arbol)-1][0]
+    pesos = \
+    Fq.inv_mult_batch(evalua_multi(derivada(w, p, f), a, p, f), p, f)
+    nivel = [reduce([Fq.mult(b[i], pesos[i], p, f)], p, f) \
+    for i in range(len(a))]
+    for h in range(0, len(arbol)-1):
+        nodos = arbol[h]
+        siguiente = []
+        for j in range(0, len(nodos)-1, 2):
+            siguiente.append(suma(mult(nivel[j], nodos[j+1], p, f), \
+            mult(nivel[j+1], nodos[j], p, f), p, f))
+        if len(nodos) % 2 == 1:
+            siguiente.append(nivel[len(nivel)-1])
+        nivel = siguiente
+    return nivel[0]
+
+def plan_interpolacion(a, p, f):
+    """
+
+    Parámetros
+    ----------
+    a : LISTA
+        CONTIENE LAS PRIMERAS COORDENADAS 
+        DE LOS PUNTOS DE INTERPOLACIÓN
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    plan : DICCIONARIO
+        CON LAS CLAVES "a" (LOS PUNTOS), "w" (EL PRODUCTO DE TODOS 
+        LOS (x-a_i)), "pesos" (LOS PESOS BARICÉNTRICOS 1/w'(a_i)) Y 
+        "base" (MATRIZ CUYA COLUMNA j SON LOS COEFICIENTES DEL 
+        POLINOMIO BÁSICO DE LAGRANGE L_j(x)), PARA INTERPOLAR 
+        CON interpola_con_plan
+
+    """
+    k = len(a)
+    arbol = arbol_subproductos(a, p, f)
+    w = arbol[len(arbol)-1][0]
+    pesos = \
+    Fq.inv_mult_batch(evalua_multi(derivada(w, p, f), a, p, f), p, f)
+    base = []
+    for j in range(k):
+        # División sintética de w(x) entre (x-a_j)
+        q = [Fq.neutro_ad(p, f)]*k
+        q[k-1] = w[k]
+        for i in range(k-1, 0, -1):
+            q[i-1] = Fq.suma(w[i], Fq.mult(a[j], q[i], p, f), p, f)
+        base.append([Fq.mult(c, pesos[j], p, f) for c in q])
+    return {"a": list(a), "w": list(w), "pesos": pesos, "base": base}
+
+def interpola_con_plan(plan, b, p, f):
+    """
+
+    Parámetros
+    ----------
+    plan : DICCIONARIO
+        PLAN DE INTERPOLACIÓN DE LOS PUNTOS a_i, 
+        CONSTRUIDO CON plan_interpolacion
+    b : LISTA
+        CONTIENE LAS SEGUNDAS COORDENADAS 
+        DE LOS PUNTOS DE INTERPOLACIÓN
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    LISTA
+        POLINOMIO DE INTERPOLACIÓN DE LAGRANGE DE LOS PUNTOS 
+        {(a_i, b_i)}_{i}, CALCULADO COMO EL PRODUCTO DE LA MATRIZ 
+        BASE DEL PLAN POR EL VECTOR b
+
+    """
+    base = plan["base"]
+    g = [Fq.neutro_ad(p, f)]*len(base)
+    for j in range(len(base)):
+        if b[j] == Fq.neutro_ad(p, f):
+            continue
+        col = base[j]
+        for i in range(len(col)):
+            g[i] = Fq.suma(g[i], Fq.mult(col[i], b[j], p, f), p, f)
+    return reduce(g, p, f)
+
 def evalua(g, a, p, f):
     """
 
@@ -322,13 +839,168 @@ def evalua(g, a, p, f):
         RESULTADO DE EVALUAR EL POLINOMIO g EN EL ELEMENTO a
 
     """
-    g_a = g[0]
-    potencia = Fq.neutro_mult(p, f)
-    for i in range(1, len(g)):
-        potencia = Fq.mult(potencia, a, p, f)
-        g_a = Fq.suma(g_a, Fq.mult(g[i], potencia, p, f), p, f)
+    if len(g) == 0:
+        return Fq.neutro_ad(p, f)
+    g_a = g[len(g)-1]
+    for i in range(len(g)-2, -1, -1):
+        g_a = Fq.suma(Fq.mult(g_a, a, p, f), g[i], p, f)
     return g_a
 
+def evalua_multi(g, a, p, f):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    a : LISTA
+        ELEMENTOS DE (Z/pZ)[x]/<f> DONDE SE QUIERE EVALUAR EL POLINOMIO g
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    LISTA
+        RESULTADOS DE EVALUAR EL POLINOMIO g EN CADA ELEMENTO DE a.
+        PARA ENTRADAS GRANDES SE USA EL ÁRBOL DE RESTOS SOBRE EL
+        ÁRBOL DE SUBPRODUCTOS DE a; EN OTRO CASO, LA REGLA DE HORNER
+
+    """
+    if len(g) < UMBRAL_ARBOL or len(a) < UMBRAL_ARBOL:
+        return [evalua(g, x, p, f) for x in a]
+    arbol = arbol_subproductos(a, p, f)
+    restos = [div(g, arbol[len(arbol)-1][0], p, f)[1]]
+    for nivel in range(len(arbol)-2, -1, -1):
+        hijos = arbol[nivel]
+        nuevos = []
+        for j in range(0, len(hijos)):
+            nuevos.append(div(restos[j//2], hijos[j], p, f)[1])
+        restos = nuevos
+    return [r[0] if len(r) > 0 else Fq.neutro_ad(p, f) for r in restos]
+
+def arbol_subproductos(a, p, f):
+    """
+
+    Parámetros
+    ----------
+    a : LISTA
+        ELEMENTOS DE (Z/pZ)[x]/<f>
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    arbol : LISTA
+        NIVELES DEL ÁRBOL DE SUBPRODUCTOS DE LOS PUNTOS a: arbol[0] 
+        CONTIENE LOS POLINOMIOS (x-a_i) Y CADA NODO DEL NIVEL SIGUIENTE 
+        ES EL PRODUCTO DE SUS DOS HIJOS (O COPIA DEL ÚLTIMO SI SOBRA 
+        UNO), DE MODO QUE LA RAÍZ ES EL PRODUCTO DE TODOS LOS (x-a_i).
+        SE GUARDA PARA REUTILIZARLO CON EL MISMO CONJUNTO DE PUNTOS
+
+    """
+    clave = (p, tuple(f), tuple(tuple(x) for x in a))
+    if clave not in _arboles:
+        nivel = [[Fq.inv_ad(x, p, f), Fq.neutro_mult(p, f)] for x in a]
+        arbol = [nivel]
+        while len(nivel) > 1:
+            siguiente = []
+            for j in range(0, len(nivel)-1, 2):
+                siguiente.append(mult(nivel[j], nivel[j+1], p, f))
+            if len(nivel) % 2 == 1:
+                siguiente.append(nivel[len(nivel)-1])
+            nivel = siguiente
+            arbol.append(nivel)
+        if len(_arboles) >= MAX_ARBOLES:
+            del _arboles[next(iter(_arboles))]
+        _arboles[clave] = arbol
+    return _arboles[clave]
+
+def derivada(g, p, f):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    LISTA
+        DERIVADA FORMAL DEL POLINOMIO g EN ((Z/pZ)[x]/<f>)[x]
+
+    """
+    d = []
+    for i in range(1, len(g)):
+        # El entero i como elemento de Z/pZ dentro de Fq
+        i_p = [i % p] if i % p != 0 else Fq.neutro_ad(p, f)
+        d.append(Fq.mult(i_p, g[i], p, f))
+    return reduce(d, p, f)
+
+def berlekamp_massey(S, p, f, historial=False):
+    """
+
+    Parámetros
+    ----------
+    S : LISTA
+        SUCESIÓN S_0, S_1, ..., S_{N-1} DE ELEMENTOS DE (Z/pZ)[x]/<f>
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+    historial : BOOLEANO, OPCIONAL
+        SI ES TRUE SE DEVUELVE TAMBIÉN EL PAR (C, L) DE CADA PREFIJO
+
+    Devuelve
+    --------
+    C : LISTA
+        POLINOMIO DE CONEXIÓN C(x) = 1 + c_1x + ... + c_Lx^L DEL 
+        REGISTRO MÁS CORTO QUE GENERA S, ES DECIR, 
+        S_m + c_1S_{m-1} + ... + c_LS_{m-L} = 0 PARA L <= m < N
+    L : ENTERO
+        COMPLEJIDAD LINEAL DE S (LONGITUD DE DICHO REGISTRO)
+    hist : LISTA, SOLO SI historial ES TRUE
+        hist[j] ES EL PAR (C, L) DE LOS j PRIMEROS TÉRMINOS DE S
+
+    """
+    C = neutro_mult(p, f)
+    B = neutro_mult(p, f)
+    L = 0
+    m = 1
+    b = Fq.neutro_mult(p, f)
+    hist = [(C, L)]
+    for j in range(len(S)):
+        # Discrepancia entre S_j y el valor que predice C(x)
+        d = S[j]
+        for l in range(1, min(L, len(C)-1)+1):
+            d = Fq.suma(d, Fq.mult(C[l], S[j-l], p, f), p, f)
+        if d == Fq.neutro_ad(p, f):
+            m += 1
+            hist.append((C, L))
+            continue
+        coef = Fq.inv_ad(Fq.mult(d, Fq.inv_mult(b, p, f), p, f), p, f)
+        nuevo = suma(C, mult([coef], [Fq.neutro_ad(p, f)]*m + B, p, f), \
+        p, f)
+        if 2*L <= j:
+            B = C
+            L = j+1-L
+            b = d
+            m = 1
+        else:
+            m += 1
+        C = nuevo
+        hist.append((C, L))
+    if historial:
+        return C, L, hist
+    return C, L
+
 def potencia_modulo(g, r, h, p, f):
     """
 
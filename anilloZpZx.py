@@ -8,10 +8,45 @@ Consideraciones:
     2) El polinomio nulo se representa con [] 
 """
 
-from copy import deepcopy
 import auxiliar as aux
 import cuerpoZpZ as ZpZ
 
+# Longitud mínima de los factores a partir de la cual mult usa Karatsuba
+UMBRAL_KARATSUBA = 64
+
+# Longitud mínima de los factores a partir de la cual mult usa la NTT,
+# módulo p o módulo varios primos combinados por el teorema chino
+UMBRAL_NTT = 512
+UMBRAL_NTT_CRT = 2048
+
+# Primos de la forma c*2^k + 1 usados para multiplicar vía NTT y el
+# teorema chino del resto cuando p no admite una NTT propia
+_PRIMOS_NTT = (998244353, 167772161, 469762049)
+
+# Raíces primitivas ya calculadas para cada primo
+_raices = {}
+
+# Grado mínimo del divisor y del cociente a partir del cual div usa 
+# la iteración de Newton
+UMBRAL_NEWTON = 512
+
+# Inversos de los divisores invertidos como series de potencias,
+# indexados por (p, h), y número máximo de ellos que se guardan
+_inversos_serie = {}
+MAX_INVERSOS_SERIE = 64
+
+# Grado a partir del cual hgcd se aplica de forma recursiva
+UMBRAL_HGCD = 32
+
+# Longitud mínima del polinomio y del número de puntos a partir de la 
+# cual evalua_multi usa el árbol de subproductos
+UMBRAL_ARBOL = 128
+
+# Árboles de subproductos ya construidos, indexados por (p, puntos),
+# y número máximo de ellos que se guardan
+_arboles = {}
+MAX_ARBOLES = 16
+
 def neutro_ad(p):
     """
 
@@ -109,12 +144,249 @@ def mult(g, h, p):
         PRODUCTO DE LOS ELEMENTOS g Y h EN (Z/pZ)[x]
 
     """
-    deg = (len(g)-1)+(len(h)-1)
-    m = [ZpZ.neutro_ad(p)]*(deg+1)
+    if min(len(g), len(h)) >= UMBRAL_NTT:
+        m = _mult_ntt(g, h, p)
+        if m is not None:
+            return reduce(m, p)
+    return reduce(_karatsuba(g, h, p), p)
+
+def _mult_ntt(g, h, p):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    m : LISTA
+        COEFICIENTES DEL PRODUCTO g*h EN (Z/pZ)[x], SIN REDUCIR,
+        CALCULADOS CON LA NTT MÓDULO p SI p = c*2^k + 1 CON 2^k 
+        SUFICIENTEMENTE GRANDE, O CON LA NTT MÓDULO LOS PRIMOS DE 
+        _PRIMOS_NTT Y EL TEOREMA CHINO DEL RESTO EN OTRO CASO
+    None
+        SI NINGUNO DE LOS DOS MÉTODOS ES APLICABLE
+
+    """
+    longitud = len(g)+len(h)-1
+    n = 1
+    while n < longitud:
+        n *= 2
+    if (p-1) % n == 0:
+        return _convolucion_ntt(g, h, n, p)[:longitud]
+    producto = 1
+    for q in _PRIMOS_NTT:
+        producto *= q
+    if min(len(g), len(h)) < UMBRAL_NTT_CRT or \
+    any((q-1) % n != 0 for q in _PRIMOS_NTT) or \
+    min(len(g), len(h))*(p-1)**2 >= producto:
+        return None
+    g = [c % p for c in g]
+    h = [c % p for c in h]
+    m = [0]*longitud
+    modulo = 1
+    for q in _PRIMOS_NTT:
+        r = _convolucion_ntt(g, h, n, q)
+        # Combinamos m (mód modulo) con r (mód q)
+        inv = aux.gcd(modulo, q)[1] % q
+        for i in range(0, longitud):
+            m[i] += modulo*(((r[i] - m[i])*inv) % q)
+        modulo *= q
+    return [c % p for c in m]
+
+def _convolucion_ntt(g, h, n, q):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO
+    n : ENTERO
+        POTENCIA DE 2 QUE DIVIDE A q-1, n >= len(g)+len(h)-1
+    q : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    LISTA
+        COEFICIENTES DEL PRODUCTO g*h EN (Z/qZ)[x] CALCULADOS CON LA 
+        TRANSFORMADA NUMÉRICA DE TAMAÑO n
+
+    """
+    w = pow(_raiz_primitiva(q), (q-1)//n, q)
+    a = _ntt(list(g) + [0]*(n-len(g)), w, q)
+    b = _ntt(list(h) + [0]*(n-len(h)), w, q)
+    c = _ntt([a[i]*b[i] % q for i in range(0, n)], pow(w, q-2, q), q)
+    inv_n = pow(n, q-2, q)
+    return [x*inv_n % q for x in c]
+
+def _ntt(a, w, q):
+    """
+
+    Parámetros
+    ----------
+    a : LISTA
+        COEFICIENTES, DE LONGITUD n POTENCIA DE 2
+    w : ENTERO
+        RAÍZ PRIMITIVA n-ÉSIMA DE LA UNIDAD MÓDULO q
+    q : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    a : LISTA
+        EVALUACIONES DEL POLINOMIO a EN LAS POTENCIAS w^0, ..., w^{n-1},
+        CALCULADAS CON EL ALGORITMO ITERATIVO DE COOLEY-TUKEY
+
+    """
+    n = len(a)
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            a[i], a[j] = a[j], a[i]
+    longitud = 2
+    while longitud <= n:
+        mitad = longitud//2
+        wl = pow(w, n//longitud, q)
+        ws = [1]*mitad
+        for i in range(1, mitad):
+            ws[i] = ws[i-1]*wl % q
+        for inicio in range(0, n, longitud):
+            for i in range(0, mitad):
+                u = a[inicio+i]
+                v = a[inicio+i+mitad]*ws[i] % q
+                a[inicio+i] = (u+v) % q
+                a[inicio+i+mitad] = (u-v) % q
+        longitud *= 2
+    return a
+
+def _raiz_primitiva(q):
+    """
+
+    Parámetros
+    ----------
+    q : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    ENTERO
+        MENOR RAÍZ PRIMITIVA MÓDULO q
+
+    """
+    if q not in _raices:
+        factores = aux.factoriza(q-1)
+        r = 1
+        while any(pow(r, (q-1)//l, q) == 1 for l in factores):
+            r += 1
+        _raices[q] = r
+    return _raices[q]
+
+def _karatsuba(g, h, p):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    m : LISTA
+        COEFICIENTES DEL PRODUCTO g*h EN (Z/pZ)[x], SIN REDUCIR,
+        CON LONGITUD len(g)+len(h)-1
+
+    """
+    if min(len(g), len(h)) < UMBRAL_KARATSUBA:
+        return _mult_escolar(g, h, p)
+    k = max(len(g), len(h))//2
+    m = [ZpZ.neutro_ad(p)]*(len(g)+len(h)-1)
+    if len(g) <= k or len(h) <= k:
+        # Factores desequilibrados: partimos solo el más largo
+        if len(h) > len(g):
+            g, h = h, g
+        partes = [(0, _karatsuba(g[:k], h, p)), (k, _karatsuba(g[k:], h, p))]
+    else:
+        g0, g1 = g[:k], g[k:]
+        h0, h1 = h[:k], h[k:]
+        z0 = _karatsuba(g0, h0, p)
+        z2 = _karatsuba(g1, h1, p)
+        z1 = _karatsuba(_suma_coefs(g0, g1, p), _suma_coefs(h0, h1, p), p)
+        z1 = _suma_coefs(z1, inv_ad(_suma_coefs(z0, z2, p), p), p)
+        partes = [(0, z0), (k, z1), (2*k, z2)]
+    for desp, z in partes:
+        for i in range(0, min(len(z), len(m)-desp)):
+            m[desp+i] = ZpZ.suma(m[desp+i], z[i], p)
+    return m
+
+def _mult_escolar(g, h, p):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    m : LISTA
+        COEFICIENTES DEL PRODUCTO g*h EN (Z/pZ)[x] CALCULADOS CON EL 
+        ALGORITMO ESCOLAR, SIN REDUCIR, CON LONGITUD len(g)+len(h)-1
+
+    """
+    if len(g) == 0 or len(h) == 0:
+        return []
+    m = [0]*(len(g)+len(h)-1)
     for i in range(0, len(g)):
-        for j in range(0, len(h)):
-            m[i+j] = ZpZ.suma(ZpZ.mult(g[i], h[j], p), m[i+j], p)
-    return reduce(m, p)
+        if g[i] != 0:
+            for j in range(0, len(h)):
+                m[i+j] += g[i]*h[j]
+    return [c % p for c in m]
+
+def _suma_coefs(g, h, p):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    s : LISTA
+        COEFICIENTES DE g+h EN (Z/pZ)[x], SIN REDUCIR
+
+    """
+    if len(g) < len(h):
+        g, h = h, g
+    s = list(g)
+    for i in range(0, len(h)):
+        s[i] = ZpZ.suma(s[i], h[i], p)
+    return s
 
 def div(g, h, p):
     """
@@ -140,26 +412,111 @@ def div(g, h, p):
     """
     if h == neutro_ad(p):
         raise ValueError("No se puede dividir por cero")
+    elif len(h)-1 >= UMBRAL_NEWTON and len(g)-len(h)+1 >= UMBRAL_NEWTON:
+        return _div_newton(g, h, p)
     else:
-        grado_pol1 = len(g)-1
         grado_pol2 = len(h)-1
-        pol1 = deepcopy(g)
-        cociente = [ZpZ.neutro_ad(p)]*(grado_pol1-grado_pol2+1)
-        while grado_pol1 >= grado_pol2:
-            pol2 = deepcopy(h)
-            a = pol1[len(pol1)-1]
-            b = pol2[len(pol2)-1]
-            c = ZpZ.mult(a, ZpZ.inv_mult(b, p), p)
-            dif = grado_pol1 - grado_pol2
-            cociente[dif] = c
-            for i in range(0, len(pol2)):
-                pol2[i] = ZpZ.mult(ZpZ.inv_ad(c, p), pol2[i], p)
-            pol2 = [ZpZ.neutro_ad(p)]*dif + pol2
-            pol1 = suma(pol1, pol2, p)
-            grado_pol1 = len(pol1)-1
-        resto = pol1
-        return cociente, resto
+        resto = list(g)
+        cociente = [ZpZ.neutro_ad(p)]*(len(g)-grado_pol2)
+        # Si h es mónico no hace falta invertir su coeficiente principal
+        b = h[grado_pol2]
+        monico = b == ZpZ.neutro_mult(p)
+        if not monico:
+            inv = ZpZ.inv_mult(b, p)
+        for i in range(len(resto)-1, grado_pol2-1, -1):
+            c = resto[i] if monico else ZpZ.mult(resto[i], inv, p)
+            if c != ZpZ.neutro_ad(p):
+                dif = i - grado_pol2
+                cociente[dif] = c
+                for j in range(0, grado_pol2):
+                    resto[dif+j] = (resto[dif+j] - c*h[j]) % p
+        return cociente, reduce(resto[:grado_pol2], p)
     
+def inverso_serie(h, m, p):
+    """
+
+    Parámetros
+    ----------
+    h : LISTA
+        POLINOMIO NO NULO
+    m : ENTERO
+        PRECISIÓN DE LA SERIE
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    inv : LISTA
+        INVERSO DEL POLINOMIO INVERTIDO x^deg(h)*h(1/x) MÓDULO x^m EN 
+        (Z/pZ)[x], DE LONGITUD m, CALCULADO CON LA ITERACIÓN DE NEWTON.
+        SE GUARDA PARA REUTILIZARLO EN DIVISIONES POR EL MISMO h
+
+    """
+    clave = (p, tuple(h))
+    rev = h[::-1]
+    if clave in _inversos_serie:
+        inv = _inversos_serie[clave]
+    else:
+        inv = [ZpZ.inv_mult(rev[0], p)]
+    if len(inv) < m:
+        while len(inv) < m:
+            k = min(2*len(inv), m)
+            # inv = inv*(2 - rev*inv) mód x^k
+            e = _trunca(inv_ad(mult(rev[:k], inv, p), p), k)
+            e[0] = ZpZ.suma(e[0], 2, p)
+            inv = _trunca(mult(inv, e, p), k)
+        if len(_inversos_serie) >= MAX_INVERSOS_SERIE:
+            del _inversos_serie[next(iter(_inversos_serie))]
+        _inversos_serie[clave] = inv
+    return inv[:m]
+
+def _div_newton(g, h, p):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO NO NULO, deg(h) <= deg(g)
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    cociente : LISTA
+    resto : LISTA
+        COCIENTE Y RESTO DE LA DIVISIÓN DE g ENTRE h EN (Z/pZ)[x], 
+        CALCULADOS CON DOS PRODUCTOS A PARTIR DEL INVERSO EN SERIE 
+        DE h INVERTIDO
+
+    """
+    k = len(g)-len(h)+1
+    inv = inverso_serie(h, k, p)
+    cociente = _trunca(mult(g[::-1][:k], inv, p), k)[::-1]
+    qh = _trunca(mult(cociente, h, p), len(h)-1)
+    resto = [ZpZ.suma(g[i], ZpZ.inv_ad(qh[i], p), p) \
+    for i in range(0, len(h)-1)]
+    return cociente, reduce(resto, p)
+
+def _trunca(g, k):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    k : ENTERO
+
+    Devuelve
+    --------
+    LISTA
+        LOS k PRIMEROS COEFICIENTES DE g (g MÓDULO x^k), 
+        COMPLETADOS CON CEROS HASTA LONGITUD k
+
+    """
+    return g[:k] + [0]*(k-len(g))
+
 def gcd(g, h, p):
     """
 
@@ -222,6 +579,176 @@ def gcd_ext(g, h, p):
     s = mult(inv, s0, p)
     return gcd, r, s
 
+def gcd_ext_parcial(g, h, d, p):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO
+    d : ENTERO
+        GRADO EN EL QUE SE DETIENE EL ALGORITMO DE EUCLIDES
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    u : LISTA
+        PRIMER RESTO DE LA SUCESIÓN DE EUCLIDES DE g Y h 
+        (EMPEZANDO EN h) CON GRADO MENOR O IGUAL QUE d
+    r : LISTA
+    s : LISTA
+        POLINOMIOS TALES QUE u = g*r + h*s
+
+    Se calcula con el algoritmo half-gcd, sin normalizar los restos
+
+    """
+    M = _matriz_identidad(p)
+    a, b = g, h
+    while len(b)-1 > d:
+        n = len(a)-1
+        R = None
+        if n > len(b)-1 and n-d > UMBRAL_HGCD:
+            k = max(0, 2*(d+1)-n)
+            R = hgcd(a[k:], b[k:], p)
+            if R == _matriz_identidad(p):
+                R = None
+        if R is None:
+            R = _paso_euclides(_matriz_identidad(p), div(a, b, p)[0], p)
+        a, b = _aplica_matriz(R, a, b, p)
+        M = _mult_matrices(R, M, p)
+    return b, M[2], M[3]
+
+def hgcd(g, h, p):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO, deg(h) < deg(g)
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    M : TUPLA
+        MATRIZ (m00, m01, m10, m11) DE POLINOMIOS TAL QUE 
+        (c, d) = (m00*g + m01*h, m10*g + m11*h) SON DOS RESTOS 
+        CONSECUTIVOS DE LA SUCESIÓN DE EUCLIDES DE g Y h CON 
+        deg(c) >= m > deg(d), SIENDO m = ceil(deg(g)/2)
+
+    """
+    m = len(g)//2
+    if len(h)-1 < m:
+        return _matriz_identidad(p)
+    if len(g)-1 < UMBRAL_HGCD:
+        M = _matriz_identidad(p)
+        while len(h)-1 >= m:
+            cociente, resto = div(g, h, p)
+            M = _paso_euclides(M, cociente, p)
+            g, h = h, resto
+        return M
+    R = hgcd(g[m:], h[m:], p)
+    c, d = _aplica_matriz(R, g, h, p)
+    if len(d)-1 < m:
+        return R
+    cociente, resto = div(c, d, p)
+    R = _paso_euclides(R, cociente, p)
+    c, d = d, resto
+    if len(d)-1 < m:
+        return R
+    k = 2*m-(len(c)-1)
+    S = hgcd(c[k:], d[k:], p)
+    return _mult_matrices(S, R, p)
+
+def _matriz_identidad(p):
+    """
+
+    Parámetros
+    ----------
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    TUPLA
+        MATRIZ IDENTIDAD 2x2 CON COEFICIENTES EN (Z/pZ)[x]
+
+    """
+    return (neutro_mult(p), neutro_ad(p), neutro_ad(p), neutro_mult(p))
+
+def _paso_euclides(M, cociente, p):
+    """
+
+    Parámetros
+    ----------
+    M : TUPLA
+        MATRIZ 2x2 CON COEFICIENTES EN (Z/pZ)[x]
+    cociente : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    TUPLA
+        PRODUCTO DE LA MATRIZ (0, 1, 1, -cociente) POR M
+
+    """
+    return (M[2], M[3], \
+    suma(M[0], inv_ad(mult(cociente, M[2], p), p), p), \
+    suma(M[1], inv_ad(mult(cociente, M[3], p), p), p))
+
+def _mult_matrices(M, N, p):
+    """
+
+    Parámetros
+    ----------
+    M : TUPLA
+        MATRIZ 2x2 CON COEFICIENTES EN (Z/pZ)[x]
+    N : TUPLA
+        MATRIZ 2x2 CON COEFICIENTES EN (Z/pZ)[x]
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    TUPLA
+        PRODUCTO DE LAS MATRICES M Y N
+
+    """
+    return (suma(mult(M[0], N[0], p), mult(M[1], N[2], p), p), \
+    suma(mult(M[0], N[1], p), mult(M[1], N[3], p), p), \
+    suma(mult(M[2], N[0], p), mult(M[3], N[2], p), p), \
+    suma(mult(M[2], N[1], p), mult(M[3], N[3], p), p))
+
+def _aplica_matriz(M, g, h, p):
+    """
+
+    Parámetros
+    ----------
+    M : TUPLA
+        MATRIZ 2x2 CON COEFICIENTES EN (Z/pZ)[x]
+    g : LISTA
+        POLINOMIO
+    h : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    TUPLA
+        POLINOMIOS (m00*g + m01*h, m10*g + m11*h)
+
+    """
+    return (suma(mult(M[0], g, p), mult(M[1], h, p), p), \
+    suma(mult(M[2], g, p), mult(M[3], h, p), p))
+
 def reduce(g, p):
     """
 
@@ -239,14 +766,9 @@ def reduce(g, p):
         CON ÚNICAMENTE LOS COEFICIENTES NECESARIOS
 
     """
-    if g == neutro_ad(p):
-        return g
-    else:
-        if (g[len(g)-1] == ZpZ.neutro_ad(p)):
-            g.pop(len(g)-1)
-            return reduce(g, p)
-        else:
-            return g
+    while len(g) > 0 and g[len(g)-1] == ZpZ.neutro_ad(p):
+        g.pop(len(g)-1)
+    return g
 
 def interpola_lagrange(k, a, b, p):
     """
@@ -271,19 +793,67 @@ def interpola_lagrange(k, a, b, p):
         DE LOS PUNTOS {(a_i, b_i)}_{i}
 
     """
+    difs = []
+    for i in range(0, k):
+        for j in range(0, k):
+            if j != i:
+                difs.append(ZpZ.suma(a[i], ZpZ.inv_ad(a[j], p), p))
+    invs = ZpZ.inv_mult_batch(difs, p)
     g = neutro_ad(p)
+    pos = 0
     for i in range(0, k):
         l_i = neutro_mult(p)
         for j in range(0, k):
             if j != i:
-                p1 = \
-                ZpZ.inv_mult(ZpZ.suma(a[i], ZpZ.inv_ad(a[j], p), p), p)
+                p1 = invs[pos]
+                pos += 1
                 p0 = ZpZ.mult(ZpZ.inv_ad(a[j], p), p1, p)
                 pol = [p0, p1]
                 l_i = mult(l_i, pol, p)
         g = suma(g, mult([b[i]], l_i, p), p)
     return g
 
+def interpola(a, b, p):
+    """
+
+    Parámetros
+    ----------
+    a : LISTA
+        CONTIENE LAS PRIMERAS COORDENADAS 
+        DE LOS PUNTOS DE INTERPOLACIÓN
+    b : LISTA
+        CONTIENE LAS SEGUNDAS COORDENADAS 
+        DE LOS PUNTOS DE INTERPOLACIÓN
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    g : LISTA
+        POLINOMIO DE INTERPOLACIÓN DE LAGRANGE DE LOS PUNTOS 
+        {(a_i, b_i)}_{i}, CALCULADO SOBRE EL ÁRBOL DE SUBPRODUCTOS 
+        DE a CON LOS PESOS b_i/w'(a_i), SIENDO w EL PRODUCTO DE 
+        TODOS LOS (x-a_i)
+
+    """
+    if len(a) == 0:
+        return neutro_ad(p)
+    arbol = arbol_subproductos(a, p)
+    w = arbol[len(arbol)-1][0]
+    pesos = ZpZ.inv_mult_batch(evalua_multi(derivada(w, p), a, p), p)
+    nivel = [reduce([ZpZ.mult(b[i], pesos[i], p)], p) \
+    for i in range(len(a))]
+    for h in range(0, len(arbol)-1):
+        nodos = arbol[h]
+        siguiente = []
+        for j in range(0, len(nodos)-1, 2):
+            siguiente.append(suma(mult(nivel[j], nodos[j+1], p), \
+            mult(nivel[j+1], nodos[j], p), p))
+        if len(nodos) % 2 == 1:
+            siguiente.append(nivel[len(nivel)-1])
+        nivel = siguiente
+    return nivel[0]
+
 def evalua(g, a, p):
     """
 
@@ -302,13 +872,101 @@ def evalua(g, a, p):
         RESULTADO DE EVALUAR EL POLINOMIO g EN EL ELEMENTO a
 
     """
-    g_a = g[0]
-    potencia = ZpZ.neutro_mult(p)
-    for i in range(1, len(g)):
-        potencia = ZpZ.mult(potencia, a, p)
-        g_a = ZpZ.suma(g_a, ZpZ.mult(g[i], potencia, p), p)
+    if len(g) == 0:
+        return ZpZ.neutro_ad(p)
+    g_a = g[len(g)-1]
+    for i in range(len(g)-2, -1, -1):
+        g_a = ZpZ.suma(ZpZ.mult(g_a, a, p), g[i], p)
     return g_a
 
+def evalua_multi(g, a, p):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    a : LISTA
+        ELEMENTOS DE Z/pZ DONDE SE QUIERE EVALUAR EL POLINOMIO g
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    LISTA
+        RESULTADOS DE EVALUAR EL POLINOMIO g EN CADA ELEMENTO DE a.
+        PARA ENTRADAS GRANDES SE USA EL ÁRBOL DE RESTOS SOBRE EL
+        ÁRBOL DE SUBPRODUCTOS DE a; EN OTRO CASO, LA REGLA DE HORNER
+
+    """
+    if len(g) < UMBRAL_ARBOL or len(a) < UMBRAL_ARBOL:
+        return [evalua(g, x, p) for x in a]
+    arbol = arbol_subproductos(a, p)
+    restos = [div(g, arbol[len(arbol)-1][0], p)[1]]
+    for nivel in range(len(arbol)-2, -1, -1):
+        hijos = arbol[nivel]
+        nuevos = []
+        for j in range(0, len(hijos)):
+            nuevos.append(div(restos[j//2], hijos[j], p)[1])
+        restos = nuevos
+    return [r[0] if len(r) > 0 else ZpZ.neutro_ad(p) for r in restos]
+
+def arbol_subproductos(a, p):
+    """
+
+    Parámetros
+    ----------
+    a : LISTA
+        ELEMENTOS DE Z/pZ
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    arbol : LISTA
+        NIVELES DEL ÁRBOL DE SUBPRODUCTOS DE LOS PUNTOS a: arbol[0] 
+        CONTIENE LOS POLINOMIOS (x-a_i) Y CADA NODO DEL NIVEL SIGUIENTE 
+        ES EL PRODUCTO DE SUS DOS HIJOS (O COPIA DEL ÚLTIMO SI SOBRA 
+        UNO), DE MODO QUE LA RAÍZ ES EL PRODUCTO DE TODOS LOS (x-a_i).
+        SE GUARDA PARA REUTILIZARLO CON EL MISMO CONJUNTO DE PUNTOS
+
+    """
+    clave = (p, tuple(a))
+    if clave not in _arboles:
+        nivel = [[ZpZ.inv_ad(x, p), ZpZ.neutro_mult(p)] for x in a]
+        arbol = [nivel]
+        while len(nivel) > 1:
+            siguiente = []
+            for j in range(0, len(nivel)-1, 2):
+                siguiente.append(mult(nivel[j], nivel[j+1], p))
+            if len(nivel) % 2 == 1:
+                siguiente.append(nivel[len(nivel)-1])
+            nivel = siguiente
+            arbol.append(nivel)
+        if len(_arboles) >= MAX_ARBOLES:
+            del _arboles[next(iter(_arboles))]
+        _arboles[clave] = arbol
+    return _arboles[clave]
+
+def derivada(g, p):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    LISTA
+        DERIVADA FORMAL DEL POLINOMIO g EN (Z/pZ)[x]
+
+    """
+    d = [ZpZ.mult(i, g[i], p) for i in range(1, len(g))]
+    return reduce(d, p)
+
 def potencia_modulo(g, r, h, p):
     """
 
@@ -118,9 +118,11 @@ r1[107] = [[random.randint(0,1) for x in range(8)] for y in range(32)]
 # PROCESO DE LECTURA DE DATOS DEL CD
 
 # Decodificar con RS en la capa 1
+S1 = bch.calcula_sindromes_bloques(r1, alpha, i, 2*((n1-k1)//2), p, f)
 s1_rs = []
 for j in range(len(r1)):
-    s1_rs_j = bch.rs_bch(k1, n1, alpha, i, g1, r1[j], p, f)
+    s1_rs_j = bch.rs_bch(k1, n1, alpha, i, g1, r1[j], p, f, "bm", "forney", \
+    S1[j])
     if len(s1_rs_j) != k1:
         s1_rs_j = s1_rs_j + [Fq.neutro_ad(p, f)]*(k1-len(s1_rs_j))
     s1_rs.append(s1_rs_j)
@@ -129,9 +131,11 @@ for j in range(len(r1)):
 r2 = desentrelazado(s1_rs)
 
 # Decodificar con RS en la capa 2
+S2 = bch.calcula_sindromes_bloques(r2, alpha, i, 2*((n2-k2)//2), p, f)
 s2_rs = []
 for j in range(len(r2)):
-    s2_rs_j = bch.rs_bch(k2, n2, alpha, i, g2, r2[j], p, f)
+    s2_rs_j = bch.rs_bch(k2, n2, alpha, i, g2, r2[j], p, f, "bm", "forney", \
+    S2[j])
     if len(s2_rs_j) != k2:
         s2_rs_j = s2_rs_j + [Fq.neutro_ad(p, f)]*(k2-len(s2_rs_j))
     s2_rs.append(s2_rs_j)
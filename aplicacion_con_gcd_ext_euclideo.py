@@ -98,10 +98,7 @@ s2 = [binario[j:j+k2] for j in range(0,len(binario),k2)]
 # Codificamos con RS en la capa 2 (codificamos cada bloque de 24 bytes)
 y2 = []
 for j in range(len(s2)):
-    y2_j = []
-    for k in range(len(a2)):
-        y2_j.append(Fqx.evalua(s2[j], a2[k], p, f))
-    y2.append(y2_j)
+    y2.append(Fqx.evalua_multi(s2[j], a2, p, f))
 
     
 # Aplicamos el entrelazado
@@ -110,10 +107,7 @@ s1 = entrelazado(y2)
 # Codificamos con RS en la capa 1
 y1 = []
 for j in range(len(s1)):
-    y1_j = []
-    for k in range(len(a1)):
-        y1_j.append(Fqx.evalua(s1[j], a1[k], p, f))
-    y1.append(y1_j)
+    y1.append(Fqx.evalua_multi(s1[j], a1, p, f))
 
 # Se graba c1 en el CD Y ocurren los errores
 r1 = deepcopy(y1)
@@ -128,10 +122,15 @@ r1[107] = [[random.randint(0,1) for x in range(8)] for y in range(32)]
 
 # PROCESO DE LECTURA DE DATOS DEL CD
 
+# Los puntos de evaluación son fijos para todo el CD, así que los planes 
+# de interpolación se construyen una sola vez
+plan1 = Fqx.plan_interpolacion(a1, p, f)
+plan2 = Fqx.plan_interpolacion(a2, p, f)
+
 # Decodificar con RS en la capa 1
 s1_rs = []
 for j in range(len(r1)):
-    s1_rs_j = rs.rs_gcd_ext_euclideo(n1, k1, a1, r1[j], p, f)
+    s1_rs_j = rs.rs_gcd_ext_euclideo(n1, k1, a1, r1[j], p, f, plan1)
     if len(s1_rs_j) != k1:
         s1_rs_j = s1_rs_j + [[]]*(k1-len(s1_rs_j))
     s1_rs.append(s1_rs_j)
@@ -142,7 +141,7 @@ r2 = desentrelazado(s1_rs)
 # Decodificar con RS en la capa 2
 s2_rs = []
 for j in range(len(r2)):
-    s2_rs_j = rs.rs_gcd_ext_euclideo(n2, k2, a2, r2[j], p, f)
+    s2_rs_j = rs.rs_gcd_ext_euclideo(n2, k2, a2, r2[j], p, f, plan2)
     if len(s2_rs_j) != k2:
         s2_rs_j = s2_rs_j + [[]]*(k2-len(s2_rs_j))
     s2_rs.append(s2_rs_j)
@@ -3,6 +3,9 @@
 AUXILIAR
 """
 
+# Bases del test de Miller-Rabin
+_BASES_MR = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
 def gcd(x,y):
     """
 
@@ -21,42 +24,21 @@ def gcd(x,y):
     m = x*a + y*b
 
     """
-    xespar = x%2 == 0
-    yespar = y%2 == 0
+    if x == 0 and y == 0:
+        return 0, 0, 1
+    r0, r1 = abs(x), abs(y)
+    a0, a1 = 1, 0
+    b0, b1 = 0, 1
+    while r1 != 0:
+        c = r0 // r1
+        r0, r1 = r1, r0 - c*r1
+        a0, a1 = a1, a0 - c*a1
+        b0, b1 = b1, b0 - c*b1
     if x < 0:
-        m,a,b = gcd(-x,y)
-        a = -a
-    elif y < 0:
-        m,a,b = gcd(x,-y)
-        b = -b
-    elif x == 0:               
-        m,a,b = y,0,1
-    elif y == 0:             
-        m,a,b = x,1,0
-    elif xespar and yespar:
-        m,a,b = gcd(x//2, y//2)
-        m *= 2
-    elif xespar:
-        m,a,b = gcd(x//2, y)
-        if a % 2 == 0:
-           a //= 2
-        else:
-           a = (a+y)//2
-           b = b - x//2
-    elif yespar:
-        m,a,b = gcd(x, y//2)
-        if b % 2 == 0:
-           b //= 2
-        else:
-           b = (b+x)//2
-           a = a - y//2
-    elif x > y:
-        m,a,b = gcd(y, x-y)
-        a,b = b,a-b
-    else:
-        m,a,b = gcd(x, y-x)
-        a -= b
-    return m,a,b
+        a0 = -a0
+    if y < 0:
+        b0 = -b0
+    return r0, a0, b0
 
 def es_primo(n):
     """
@@ -69,23 +51,91 @@ def es_primo(n):
     --------
     TRUE: SI n ES PRIMO
     FALSE: SI n ES COMPUESTO
+
+    Test de Miller-Rabin con las bases de _BASES_MR, determinista
+    para n < 3.3*10^24 (en particular para cualquier entero de 64 bits)
     
     """
-    
-    if n==2 or n==3:
-        return True
-    
-    elif n%2==0:
+    if n < 2:
         return False
-    
-    else:
-        i=1
-        while i*i<=n:
-            i+=2
-            if n%i==0:
-                return False
+    for b in _BASES_MR:
+        if n % b == 0:
+            return n == b
+    d = n-1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for b in _BASES_MR:
+        x = pow(b, d, n)
+        if x == 1 or x == n-1:
+            continue
+        for j in range(s-1):
+            x = x*x % n
+            if x == n-1:
+                break
+        else:
+            return False
     return True
 
+def factoriza(m):
+    """
+
+    Parámetros
+    ----------
+    m : ENTERO, m >= 1
+
+    Devuelve
+    --------
+    primos : LISTA
+        DIVISORES PRIMOS DISTINTOS DE m ORDENADOS DE MENOR A MAYOR
+
+    """
+    primos = set()
+    pendientes = [m]
+    while pendientes:
+        n = pendientes.pop()
+        if n == 1:
+            continue
+        if es_primo(n):
+            primos.add(n)
+            continue
+        d = _divisor(n)
+        pendientes.append(d)
+        pendientes.append(n//d)
+    return sorted(primos)
+
+def _divisor(n):
+    """
+
+    Parámetros
+    ----------
+    n : ENTERO
+        COMPUESTO
+
+    Devuelve
+    --------
+    d : ENTERO
+        DIVISOR NO TRIVIAL DE n (DIVISIÓN POR TANTEO PARA FACTORES 
+        PEQUEÑOS Y RHO DE POLLARD PARA EL RESTO)
+
+    """
+    for d in range(2, 1000):
+        if n % d == 0:
+            return d
+    c = 1
+    while True:
+        x = y = 2
+        d = 1
+        while d == 1:
+            x = (x*x + c) % n
+            y = (y*y + c) % n
+            y = (y*y + c) % n
+            d = gcd(abs(x-y), n)[0]
+        if d != n:
+            return d
+        c += 1
+
 def calcula_ps(m):
     """
 
@@ -96,14 +146,11 @@ def calcula_ps(m):
     Devuelve
     --------
     ps : LISTA
-        CONTIENE TODOS LOS DIVISORES PRIMOS DE m 
+        CONTIENE 1 Y LOS COCIENTES m/q PARA CADA DIVISOR PRIMO q < m DE m
 
     """
     ps = [1]
-    for i in range(2, m):
-        if es_primo(i) and (m%i == 0):
-            ps.append(m//i)
+    for q in factoriza(m):
+        if q < m:
+            ps.append(m//q)
     return ps
-
-
-
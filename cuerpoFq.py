@@ -7,8 +7,15 @@ Consideraciones:
     2) q = p^n con n = deg(f)
 """ 
 
+import math
 import anilloZpZx as ZpZx
 
+# Tablas exp/log ya construidas para cada cuerpo, indexadas por (p, f)
+_tablas = {}
+
+# Orden máximo del cuerpo para el que se construyen tablas exp/log
+MAX_ORDEN_TABLAS = 2**16
+
 def neutro_ad(p, f):
     """
 
@@ -107,7 +114,15 @@ def mult(g, h, p, f):
         PRODUCTO DE LOS ELEMENTOS g Y h EN Z/pZ[x]
 
     """
-    return ZpZx.div(ZpZx.mult(g, h, p), f, p)[1]
+    tab = tablas(p, f)
+    if tab is None:
+        return ZpZx.div(ZpZx.mult(g, h, p), f, p)[1]
+    exp, log, elementos = tab
+    a = log[a_entero(g, p, f)]
+    b = log[a_entero(h, p, f)]
+    if a is None or b is None:
+        return neutro_ad(p, f)
+    return list(elementos[exp[(a + b) % len(exp)]])
 
 def inv_mult(g, p, f):
     """
@@ -127,7 +142,49 @@ def inv_mult(g, p, f):
         ELEMENTO INVERSO MULTIPLICATIVO DE g EN (Z/pZ)[x]/<f>
 
     """
-    return ZpZx.div(ZpZx.gcd_ext(f, g, p)[2], f, p)[1]
+    tab = tablas(p, f)
+    if tab is None:
+        return ZpZx.div(ZpZx.gcd_ext(f, g, p)[2], f, p)[1]
+    exp, log, elementos = tab
+    a = log[a_entero(g, p, f)]
+    if a is None:
+        return neutro_ad(p, f)
+    return list(elementos[exp[-a % len(exp)]])
+
+def inv_mult_batch(a, p, f):
+    """
+
+    Parámetros
+    ----------
+    a : LISTA
+        ELEMENTOS DE (Z/pZ)[x]/<f>
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    inv : LISTA
+        INVERSOS MULTIPLICATIVOS DE LOS ELEMENTOS DE a EN (Z/pZ)[x]/<f>,
+        CALCULADOS CON UNA ÚNICA INVERSIÓN (TRUCO DE MONTGOMERY)
+
+    """
+    nulos = [ZpZx.reduce(list(g), p) == neutro_ad(p, f) for g in a]
+    inv = [neutro_ad(p, f) for g in a]
+    prefijos = []
+    acum = neutro_mult(p, f)
+    for i in range(len(a)):
+        if not nulos[i]:
+            acum = mult(acum, a[i], p, f)
+        prefijos.append(acum)
+    acum = inv_mult(acum, p, f)
+    for i in range(len(a)-1, -1, -1):
+        if not nulos[i]:
+            previo = prefijos[i-1] if i > 0 else neutro_mult(p, f)
+            inv[i] = mult(acum, previo, p, f)
+            acum = mult(acum, a[i], p, f)
+    return inv
 
 def potencia(g, r, p, f):
     """
@@ -149,6 +206,15 @@ def potencia(g, r, p, f):
         ELEMENTO g^r PERTENECIENTE A (Z/pZ)[x]/<f>
 
     """
+    tab = tablas(p, f)
+    if tab is not None:
+        exp, log, elementos = tab
+        a = log[a_entero(g, p, f)]
+        if r == 0:
+            return neutro_mult(p, f)
+        if a is None:
+            return neutro_ad(p, f)
+        return list(elementos[exp[(a*r) % len(exp)]])
     if r<0:
         g = inv_mult(g, p, f)
         r = -r
@@ -163,6 +229,52 @@ def potencia(g, r, p, f):
         x = mult(g, x, p, f)
     return x 
 
+def logaritmo(g, alpha, p, f):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        ELEMENTO DE (Z/pZ)[x]/<f>
+    alpha : LISTA
+        ELEMENTO NO NULO DE (Z/pZ)[x]/<f>
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    e : ENTERO
+        MENOR EXPONENTE e >= 0 TAL QUE alpha^e = g, 
+        None SI g NO ES UNA POTENCIA DE alpha
+
+    """
+    tab = tablas(p, f)
+    if tab is not None:
+        exp, log = tab[0], tab[1]
+        lg = log[a_entero(g, p, f)]
+        la = log[a_entero(alpha, p, f)]
+        if lg is None or la is None:
+            return None
+        # Resolvemos la*e = lg (mod q-1)
+        m = len(exp)
+        d = math.gcd(la, m)
+        if lg % d != 0:
+            return None
+        m = m//d
+        return (lg//d)*pow(la//d, -1, m) % m
+    g = ZpZx.reduce(list(g), p)
+    x = neutro_mult(p, f)
+    e = 0
+    while True:
+        if x == g:
+            return e
+        x = mult(x, alpha, p, f)
+        e += 1
+        if x == neutro_mult(p, f):
+            return None
+
 def rand(n, p, f):
     """
 
@@ -181,4 +293,127 @@ def rand(n, p, f):
         POLINOMIO ALEATORIO DE GRADO n DE (Z/pZ)[x]/<f>
 
     """
-    return ZpZx.rand(n, p)
\ No newline at end of file
+    return ZpZx.rand(n, p)
+
+def tablas(p, f):
+    """
+
+    Parámetros
+    ----------
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    exp : LISTA
+        exp[e] ES EL ELEMENTO alpha^e CODIFICADO COMO ENTERO EN BASE p,
+        SIENDO alpha UN GENERADOR DE Fq*
+    log : LISTA
+        log[x] ES EL EXPONENTE e TAL QUE alpha^e = x (None SI x ES NULO)
+    elementos : LISTA
+        elementos[x] ES LA TUPLA DE COEFICIENTES DEL ELEMENTO x
+
+    None SI EL CUERPO ES DEMASIADO GRANDE O f NO ES IRREDUCIBLE
+
+    Las tablas se construyen una única vez para cada par (p, f)
+
+    """
+    clave = (p, tuple(f))
+    if clave not in _tablas:
+        n = len(f)-1
+        tab = None
+        if p**n <= MAX_ORDEN_TABLAS and (n == 1 or ZpZx.irreducible(f, p)):
+            tab = _construye_tablas(p, f)
+        _tablas[clave] = tab
+    return _tablas[clave]
+
+def _construye_tablas(p, f):
+    """
+
+    Parámetros
+    ----------
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO MÓNICO E IRREDUCIBLE
+
+    Devuelve
+    --------
+    exp, log, elementos : LISTAS
+        TABLAS DESCRITAS EN tablas(p, f)
+
+    """
+    n = len(f)-1
+    q = p**n
+    elementos = [tuple(a_lista(x, p, f)) for x in range(q)]
+    # Probamos candidatos a generador de Fq* empezando por x
+    for candidato in list(range(p, q)) + list(range(2, p)) + [1]:
+        alpha = elementos[candidato]
+        exp = [1]
+        log = [None]*q
+        log[1] = 0
+        x = 1
+        for e in range(1, q-1):
+            x = a_entero(ZpZx.div(ZpZx.mult(elementos[x], alpha, p), \
+            f, p)[1], p, f)
+            if log[x] is not None:
+                break
+            log[x] = e
+            exp.append(x)
+        if len(exp) == q-1:
+            return exp, log, elementos
+    return None
+
+def a_entero(g, p, f):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        ELEMENTO DE (Z/pZ)[x]/<f>
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    x : ENTERO
+        COEFICIENTES DE g LEÍDOS COMO DÍGITOS EN BASE p
+        (MÁSCARA DE BITS SI p = 2)
+
+    """
+    # Reducimos todos los coeficientes módulo p antes que el grado
+    g = ZpZx.reduce([c % p for c in g], p)
+    if len(g) >= len(f):
+        g = ZpZx.div(g, f, p)[1]
+    x = 0
+    for c in reversed(g):
+        x = x*p + c
+    return x
+
+def a_lista(x, p, f):
+    """
+
+    Parámetros
+    ----------
+    x : ENTERO
+        ELEMENTO DE (Z/pZ)[x]/<f> CODIFICADO COMO ENTERO EN BASE p
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    g : LISTA
+        ELEMENTO x REPRESENTADO COMO POLINOMIO
+
+    """
+    g = []
+    while x > 0:
+        g.append(x % p)
+        x //= p
+    return g
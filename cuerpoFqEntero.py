@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+IMPLEMENTACIÓN DEL CUERPO Fq:= (Z/pZ)[x]/<f(x)> CON ELEMENTOS ENTEROS
+
+Consideraciones:
+    1) f debe ser mónico e irreducible
+    2) q = p^n con n = deg(f)
+    3) El elemento c0 + c1x + ... + c_{n-1}x^{n-1} se representa con
+    el entero c0 + c1*p + ... + c_{n-1}*p^{n-1} (máscara de bits si p = 2)
+    4) Las conversiones con la representación en listas de cuerpoFq
+    se hacen con Fq.a_entero y Fq.a_lista
+"""
+
+import random
+import cuerpoFq as Fq
+
+def neutro_ad(p, f):
+    """
+
+    Parámetros
+    ----------
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    ENTERO
+        NEUTRO ADITIVO DE (Z/pZ)[x]/<f(x)>
+
+    """
+    return 0
+
+def neutro_mult(p, f):
+    """
+
+    Parámetros
+    ----------
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    ENTERO
+        NEUTRO MULTIPLICATIVO DE (Z/pZ)[x]/<f(x)>
+
+    """
+    return 1
+
+def suma(a, b, p, f):
+    """
+
+    Parámetros
+    ----------
+    a : ENTERO
+        ELEMENTO DE (Z/pZ)[x]/<f>
+    b : ENTERO
+        ELEMENTO DE (Z/pZ)[x]/<f>
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    s : ENTERO
+        SUMA DE LOS ELEMENTOS a Y b EN (Z/pZ)[x]/<f>
+
+    """
+    if p == 2:
+        return a ^ b
+    s = 0
+    potencia = 1
+    while a > 0 or b > 0:
+        s += ((a % p + b % p) % p)*potencia
+        a //= p
+        b //= p
+        potencia *= p
+    return s
+
+def inv_ad(a, p, f):
+    """
+
+    Parámetros
+    ----------
+    a : ENTERO
+        ELEMENTO DE (Z/pZ)[x]/<f>
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    inv : ENTERO
+        ELEMENTO INVERSO ADITIVO DE a EN (Z/pZ)[x]/<f>
+
+    """
+    if p == 2:
+        return a
+    inv = 0
+    potencia = 1
+    while a > 0:
+        inv += ((-a) % p)*potencia
+        a //= p
+        potencia *= p
+    return inv
+
+def mult(a, b, p, f):
+    """
+
+    Parámetros
+    ----------
+    a : ENTERO
+        ELEMENTO DE (Z/pZ)[x]/<f>
+    b : ENTERO
+        ELEMENTO DE (Z/pZ)[x]/<f>
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    ENTERO
+        PRODUCTO DE LOS ELEMENTOS a Y b EN (Z/pZ)[x]/<f>
+
+    """
+    if a == 0 or b == 0:
+        return 0
+    tab = Fq.tablas(p, f)
+    if tab is not None:
+        exp, log = tab[0], tab[1]
+        return exp[(log[a] + log[b]) % len(exp)]
+    if p == 2:
+        return _mult_binario(a, b, f)
+    return Fq.a_entero(Fq.mult(Fq.a_lista(a, p, f), Fq.a_lista(b, p, f), \
+    p, f), p, f)
+
+def inv_mult(a, p, f):
+    """
+
+    Parámetros
+    ----------
+    a : ENTERO
+        ELEMENTO DE (Z/pZ)[x]/<f>
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    ENTERO
+        ELEMENTO INVERSO MULTIPLICATIVO DE a EN (Z/pZ)[x]/<f>
+
+    """
+    if a == 0:
+        return 0
+    tab = Fq.tablas(p, f)
+    if tab is not None:
+        exp, log = tab[0], tab[1]
+        return exp[-log[a] % len(exp)]
+    return Fq.a_entero(Fq.inv_mult(Fq.a_lista(a, p, f), p, f), p, f)
+
+def potencia(a, r, p, f):
+    """
+
+    Parámetros
+    ----------
+    a : ENTERO
+        ELEMENTO DE (Z/pZ)[x]/<f>
+    r : ENTERO
+        EXPONENTE AL QUE SE QUIERE ELEVAR EL ELEMENTO a
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    x : ENTERO
+        ELEMENTO a^r PERTENECIENTE A (Z/pZ)[x]/<f>
+
+    """
+    if r == 0:
+        return 1
+    if a == 0:
+        return 0
+    tab = Fq.tablas(p, f)
+    if tab is not None:
+        exp, log = tab[0], tab[1]
+        return exp[(log[a]*r) % len(exp)]
+    if r < 0:
+        a = inv_mult(a, p, f)
+        r = -r
+    x = 1
+    while r > 0:
+        if r % 2 == 1:
+            x = mult(x, a, p, f)
+        a = mult(a, a, p, f)
+        r //= 2
+    return x
+
+def rand(n, p, f):
+    """
+
+    Parámetros
+    ----------
+    n : ENTERO
+        GRADO DE UN POLINOMIO (n<deg(f))
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    ENTERO
+        ELEMENTO ALEATORIO DE GRADO A LO SUMO n DE (Z/pZ)[x]/<f>
+
+    """
+    return random.randrange(p**(n+1))
+
+def _mult_binario(a, b, f):
+    """
+
+    Parámetros
+    ----------
+    a : ENTERO
+        ELEMENTO DE (Z/2Z)[x]/<f> COMO MÁSCARA DE BITS
+    b : ENTERO
+        ELEMENTO DE (Z/2Z)[x]/<f> COMO MÁSCARA DE BITS
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    m : ENTERO
+        PRODUCTO SIN ACARREO DE a Y b REDUCIDO MÓDULO f
+
+    """
+    n = len(f)-1
+    modulo = 0
+    for c in reversed(f):
+        modulo = 2*modulo + c
+    m = 0
+    while b > 0:
+        if b & 1:
+            m ^= a
+        a <<= 1
+        if (a >> n) & 1:
+            a ^= modulo
+        b >>= 1
+    return m
@@ -4,7 +4,12 @@ IMPLEMENTACIÓN DEL CUERPO Z/pZ
 """
 
 import random
-import auxiliar as aux
+
+# Tablas de inversos ya construidas para cada primo p
+_inversos = {}
+
+# Primo máximo para el que se construye la tabla de inversos
+MAX_PRIMO_TABLA = 2**16
 
 def neutro_ad(p):
     """
@@ -112,8 +117,48 @@ def inv_mult(a, p):
         ELEMENTO INVERSO MULTIPLICATIVO DE a EN Z/pZ
 
     """
-    g,b,c = aux.gcd(a, p)
-    return b%p
+    if p <= MAX_PRIMO_TABLA:
+        if p not in _inversos:
+            inv = [0, 1] + [0]*(p-2)
+            for i in range(2, p):
+                inv[i] = (-(p//i)*inv[p % i]) % p
+            _inversos[p] = inv
+        return _inversos[p][a % p]
+    if a % p == 0:
+        return 0
+    return pow(a, -1, p)
+
+def inv_mult_batch(a, p):
+    """
+
+    Parámetros
+    ----------
+    a : LISTA
+        ELEMENTOS DE Z/pZ
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    inv : LISTA
+        INVERSOS MULTIPLICATIVOS DE LOS ELEMENTOS DE a EN Z/pZ,
+        CALCULADOS CON UNA ÚNICA INVERSIÓN (TRUCO DE MONTGOMERY)
+
+    """
+    inv = [neutro_ad(p)]*len(a)
+    prefijos = []
+    acum = neutro_mult(p)
+    for x in a:
+        if x % p != neutro_ad(p):
+            acum = mult(acum, x, p)
+        prefijos.append(acum)
+    acum = inv_mult(acum, p)
+    for i in range(len(a)-1, -1, -1):
+        if a[i] % p != neutro_ad(p):
+            previo = prefijos[i-1] if i > 0 else neutro_mult(p)
+            inv[i] = mult(acum, previo, p)
+            acum = mult(acum, a[i], p)
+    return inv
 
 def potencia(a, r, p):
     """
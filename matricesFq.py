@@ -7,9 +7,13 @@ Consideraciones:
 """
 
 import random
-from copy import deepcopy
 import cuerpoFq as Fq
+import anilloFqx as Fqx
+import anilloZpZx as ZpZx
 
+# Tamaño mínimo (filas, columnas y dimensión interna) a partir del cual
+# mult divide las matrices en bloques y aplica un paso de Strassen
+UMBRAL_STRASSEN = 128
 
 def neutro_ad(m, n, p, f):
     """
@@ -75,7 +79,7 @@ def suma(A, B, p, f):
     s = neutro_ad(m, n, p, f)
     for i in range(0, m):
         for j in range(0, n):
-            s[i][j] = Fq.suma(A[i][j], B[i][j], p, f)
+            s[j][i] = Fq.suma(A[j][i], B[j][i], p, f)
     return s     
 
 def inv_ad(A, p, f):
@@ -101,7 +105,7 @@ def inv_ad(A, p, f):
     inv = neutro_ad(m, n, p, f)
     for i in range(0, m):
         for j in range(0, n):
-            inv[i][j] = Fq.inv_ad(A[i][j], p, f)
+            inv[j][i] = Fq.inv_ad(A[j][i], p, f)
     return inv 
                 
 def mult(A, B, p, f):
@@ -121,26 +125,193 @@ def mult(A, B, p, f):
 
     Devuelve
     --------
-    prod : LISTA
-           PRODUCTO DE LAS MATRICES A Y B EN Fq
+    LISTA
+        PRODUCTO DE LAS MATRICES A Y B EN Fq. CADA ELEMENTO g SE CODIFICA
+        UNA SOLA VEZ COMO EL ENTERO g(2^b) (SUSTITUCIÓN DE KRONECKER),
+        EL PRODUCTO SE HACE CON ENTEROS SIN REDUCIR (STRASSEN POR
+        ENCIMA DE UMBRAL_STRASSEN) Y CADA ELEMENTO DEL RESULTADO SE
+        REDUCE MÓDULO p Y MÓDULO f UNA ÚNICA VEZ
+
+    """
+    m = len(A[0]) if len(A) > 0 else 0
+    n = len(A)
+    if n == 0 or m == 0 or len(B) == 0:
+        return neutro_ad(m, len(B), p, f)
+    grado = 1
+    for M in (A, B):
+        for col in M:
+            for x in col:
+                grado = max(grado, len(x))
+    # Los coeficientes del resultado sin reducir son sumas de n*grado
+    # productos de coeficientes en {0, ..., p-1}, así que caben en b bits
+    # (las restas de Strassen solo aparecen en resultados intermedios)
+    b = max(1, (n*grado*(p-1)**2).bit_length())
+    X = [[_codifica(A[k][i], b, p) for k in range(n)] for i in range(m)]
+    Y = [[_codifica(B[l][k], b, p) for l in range(len(B))] \
+    for k in range(n)]
+    Z = _mult_enteros(X, Y)
+    return [[_decodifica(Z[i][l], b, p, f) for i in range(m)] \
+    for l in range(len(B))]
+
+def _codifica(g, b, p):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        ELEMENTO DE Fq
+    b : ENTERO
+        NÚMERO DE BITS DE CADA COEFICIENTE
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    x : ENTERO
+        VALOR g(2^b)
+
+    """
+    x = 0
+    for c in reversed(g):
+        x = (x << b) | (c % p)
+    return x
+
+def _decodifica(x, b, p, f):
+    """
+
+    Parámetros
+    ----------
+    x : ENTERO
+        VALOR h(2^b) DE UN POLINOMIO h CON COEFICIENTES ENTEROS
+        EN {0, ..., 2^b - 1}
+    b : ENTERO
+        NÚMERO DE BITS DE CADA COEFICIENTE
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    LISTA
+        ELEMENTO h MÓDULO p Y MÓDULO f DE Fq
+
+    """
+    mascara = (1 << b)-1
+    h = []
+    while x > 0:
+        h.append((x & mascara) % p)
+        x >>= b
+    h = ZpZx.reduce(h, p)
+    if len(h) >= len(f):
+        return ZpZx.div(h, f, p)[1]
+    return h
+
+def _mult_enteros(X, Y):
+    """
+
+    Parámetros
+    ----------
+    X : LISTA
+        MATRIZ DE ENTEROS DE TAMAÑO m x n, POR FILAS
+    Y : LISTA
+        MATRIZ DE ENTEROS DE TAMAÑO n x l, POR FILAS
+
+    Devuelve
+    --------
+    LISTA
+        PRODUCTO XY POR FILAS. SI TODAS LAS DIMENSIONES SUPERAN
+        UMBRAL_STRASSEN SE HACE UN PASO DE STRASSEN (SIETE PRODUCTOS DE
+        BLOQUES EN LUGAR DE OCHO); SI NO, PRODUCTOS ESCALARES DIRECTOS
 
     """
-    m1 = len(A[0])
-    n1 = len(A)
-    m2 = len(B[0])
-    n2 = len(B)
-    prod = neutro_ad(m1, n2, p, f)
-    for i in range(0, n2):
-        for j in range(0, m1):
-            prod[i][j] = Fq.neutro_ad(p, f)
-            for k in range(0, n1):
-                m = Fq.mult(A[k][j], B[i][k], p, f)
-                prod[i][j] = Fq.suma(prod[i][j], m, p, f)       
-    return prod 
-           
+    m, n, l = len(X), len(Y), len(Y[0])
+    if min(m, n, l) < UMBRAL_STRASSEN:
+        columnas = list(zip(*Y))
+        return [[sum([x*y for (x, y) in zip(fila, col)]) \
+        for col in columnas] for fila in X]
+    h1, h2, h3 = (m+1)//2, (n+1)//2, (l+1)//2
+    # Completamos con ceros hasta tener dimensiones pares
+    X = [fila + [0]*(2*h2-n) for fila in X] + [[0]*(2*h2)]*(2*h1-m)
+    Y = [fila + [0]*(2*h3-l) for fila in Y] + [[0]*(2*h3)]*(2*h2-n)
+    X11 = [fila[:h2] for fila in X[:h1]]
+    X12 = [fila[h2:] for fila in X[:h1]]
+    X21 = [fila[:h2] for fila in X[h1:]]
+    X22 = [fila[h2:] for fila in X[h1:]]
+    Y11 = [fila[:h3] for fila in Y[:h2]]
+    Y12 = [fila[h3:] for fila in Y[:h2]]
+    Y21 = [fila[:h3] for fila in Y[h2:]]
+    Y22 = [fila[h3:] for fila in Y[h2:]]
+    M1 = _mult_enteros(_comb(X11, X22, 1), _comb(Y11, Y22, 1))
+    M2 = _mult_enteros(_comb(X21, X22, 1), Y11)
+    M3 = _mult_enteros(X11, _comb(Y12, Y22, -1))
+    M4 = _mult_enteros(X22, _comb(Y21, Y11, -1))
+    M5 = _mult_enteros(_comb(X11, X12, 1), Y22)
+    M6 = _mult_enteros(_comb(X21, X11, -1), _comb(Y11, Y12, 1))
+    M7 = _mult_enteros(_comb(X12, X22, -1), _comb(Y21, Y22, 1))
+    C11 = _comb(_comb(M1, M4, 1), _comb(M7, M5, -1), 1)
+    C12 = _comb(M3, M5, 1)
+    C21 = _comb(M2, M4, 1)
+    C22 = _comb(_comb(M1, M2, -1), _comb(M3, M6, 1), 1)
+    # Unimos los bloques y quitamos las filas y columnas añadidas
+    return [(C11[i] + C12[i])[:l] for i in range(h1)] + \
+    [(C21[i] + C22[i])[:l] for i in range(m-h1)]
+
+def _comb(X, Y, s):
+    """
+
+    Parámetros
+    ----------
+    X : LISTA
+        MATRIZ DE ENTEROS, POR FILAS
+    Y : LISTA
+        MATRIZ DE ENTEROS DEL MISMO TAMAÑO, POR FILAS
+    s : ENTERO
+        1 O -1
+
+    Devuelve
+    --------
+    LISTA
+        MATRIZ X + sY
+
+    """
+    if s == 1:
+        return [[x + y for (x, y) in zip(u, v)] for (u, v) in zip(X, Y)]
+    return [[x - y for (x, y) in zip(u, v)] for (u, v) in zip(X, Y)]
+
 def det(A, p, f):
     """
 
+    Parámetros
+    ----------
+    A : LISTA
+        MATRIZ CUADRADA
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    d : LISTA
+        DETERMINANTE DE LA MATRIZ A EN Fq, CALCULADO COMO EL PRODUCTO 
+        DE LOS PIVOTES DE SU FACTORIZACIÓN LU (SIN MODIFICAR A)
+
+    """
+    n = len(A)
+    F = lu(A, p, f)
+    if len(F["pivotes"]) < n:
+        return Fq.neutro_ad(p, f)
+    d = Fq.neutro_mult(p, f)
+    if F["signo"] == -1:
+        d = Fq.inv_ad(d, p, f)
+    for k in range(n):
+        d = Fq.mult(d, F["U"][k][k], p, f)
+    return d
+
+def rango(A, p, f):
+    """
+
     Parámetros
     ----------
     A : LISTA
@@ -153,25 +324,151 @@ def det(A, p, f):
     Devuelve
     --------
     ENTERO
-        DETERMINANTE DE LA MATRIZ A EN Fq
-
-    """
-    if len(A) == 1:
-        return A[0][0]
-    if len(A) == 2:
-        return Fq.suma(Fq.mult(A[0][0], A[1][1], p, f), \
-        Fq.inv_ad(Fq.mult(A[0][1], A[1][0], p, f), p, f), p, f)
-    det_val = Fq.neutro_ad(p, f)
-    for j in range(len(A)):
-        B = deepcopy(A)
-        B.pop(j)
-        for k in range(len(B)):
-            B[k] = B[k][1:]
-        cofactor = det(B, p, f)
-        if j % 2 == 1:
-            cofactor = Fq.inv_ad(cofactor, p, f)  
-        det_val = Fq.suma(det_val, Fq.mult(A[j][0], cofactor, p, f), p, f)
-    return det_val
+        RANGO DE LA MATRIZ A EN Fq (SIN MODIFICAR A)
+
+    """
+    return len(lu(A, p, f)["pivotes"])
+
+def lu(A, p, f):
+    """
+
+    Parámetros
+    ----------
+    A : LISTA
+        MATRIZ DE TAMAÑO m x n
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    F : DICCIONARIO
+        FACTORIZACIÓN PA = LU DE A EN Fq, CON LAS CLAVES "L" (MATRIZ 
+        m x m TRIANGULAR INFERIOR CON UNOS EN LA DIAGONAL), "U" (MATRIZ 
+        m x n ESCALONADA), "perm" (LA FILA i DE PA ES LA FILA perm[i] 
+        DE A), "pivotes" (COLUMNAS DE LOS PIVOTES DE U) Y "signo" 
+        (SIGNO DE LA PERMUTACIÓN P). LA MATRIZ A NO SE MODIFICA
+
+    """
+    n = len(A)
+    m = len(A[0]) if n > 0 else 0
+    cero = Fq.neutro_ad(p, f)
+    # Trabajamos por filas sobre una copia de A
+    U = [[A[j][i] for j in range(n)] for i in range(m)]
+    L = [[cero]*m for i in range(m)]
+    perm = list(range(m))
+    signo = 1
+    pivotes = []
+    r = 0
+    for j in range(n):
+        if r == m:
+            break
+        i = r
+        while i<m and U[i][j] == cero:
+            i += 1
+        if i == m:
+            continue
+        if i != r:
+            U[i], U[r] = U[r], U[i]
+            L[i], L[r] = L[r], L[i]
+            perm[i], perm[r] = perm[r], perm[i]
+            signo = -signo
+        inv = Fq.inv_mult(U[r][j], p, f)
+        for i in range(r+1, m):
+            if U[i][j] != cero:
+                factor = Fq.mult(U[i][j], inv, p, f)
+                L[i][r] = factor
+                factor = Fq.inv_ad(factor, p, f)
+                for k in range(j, n):
+                    U[i][k] = Fq.suma(U[i][k], \
+                    Fq.mult(factor, U[r][k], p, f), p, f)
+        pivotes.append(j)
+        r += 1
+    for i in range(m):
+        L[i][i] = Fq.neutro_mult(p, f)
+    # Devolvemos L y U por columnas
+    return {"L": [[L[i][j] for i in range(m)] for j in range(m)], \
+    "U": [[U[i][j] for i in range(m)] for j in range(n)], \
+    "perm": perm, "pivotes": pivotes, "signo": signo}
+
+def resuelve(F, b, p, f, libres=None):
+    """
+
+    Parámetros
+    ----------
+    F : DICCIONARIO
+        FACTORIZACIÓN LU DE UNA MATRIZ A DE TAMAÑO m x n, 
+        OBTENIDA CON lu(A, p, f)
+    b : LISTA
+        VECTOR DE m TÉRMINOS INDEPENDIENTES
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+    libres : LISTA, OPCIONAL
+        VALOR QUE SE DA A LAS VARIABLES LIBRES (CERO POR DEFECTO)
+
+    Devuelve
+    --------
+    x : LISTA
+        VECTOR DE n ELEMENTOS DE Fq SOLUCIÓN DE Ax = b, 
+        None SI EL SISTEMA ES INCOMPATIBLE
+
+    """
+    L, U, pivotes = F["L"], F["U"], F["pivotes"]
+    m = len(F["perm"])
+    n = len(U)
+    cero = Fq.neutro_ad(p, f)
+    if libres is None:
+        libres = cero
+    # Ly = Pb
+    y = [b[F["perm"][i]] for i in range(m)]
+    for j in range(m):
+        if y[j] != cero:
+            for i in range(j+1, m):
+                if L[j][i] != cero:
+                    y[i] = Fq.suma(y[i], \
+                    Fq.inv_ad(Fq.mult(L[j][i], y[j], p, f), p, f), p, f)
+    r = len(pivotes)
+    for i in range(r, m):
+        if y[i] != cero:
+            return None
+    # Ux = y, empezando por el último pivote
+    x = [libres]*n
+    for k in range(r-1, -1, -1):
+        c = pivotes[k]
+        s = y[k]
+        for j in range(c+1, n):
+            if U[j][k] != cero and x[j] != cero:
+                s = Fq.suma(s, Fq.inv_ad(Fq.mult(U[j][k], x[j], p, f), \
+                p, f), p, f)
+        x[c] = Fq.mult(s, Fq.inv_mult(U[c][k], p, f), p, f)
+    return x
+
+def resuelve_varios(F, B, p, f):
+    """
+
+    Parámetros
+    ----------
+    F : DICCIONARIO
+        FACTORIZACIÓN LU DE UNA MATRIZ A, OBTENIDA CON lu(A, p, f)
+    B : LISTA
+        MATRIZ CUYAS COLUMNAS SON LOS VECTORES DE TÉRMINOS 
+        INDEPENDIENTES
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    LISTA
+        SOLUCIONES DE Ax = b PARA CADA COLUMNA b DE B (None PARA LOS 
+        SISTEMAS INCOMPATIBLES), REUTILIZANDO LA MISMA FACTORIZACIÓN
+
+    """
+    return [resuelve(F, b, p, f) for b in B]
 
 def eliminacion_gaussiana(A, p, f):
     """
@@ -213,6 +510,43 @@ def eliminacion_gaussiana(A, p, f):
                         p, f)
     return A
 
+def resuelve_hankel(s, t, p, f):
+    """
+
+    Parámetros
+    ----------
+    s : LISTA
+        SUCESIÓN s_0, s_1, ..., s_{2t-1} DE ELEMENTOS DE Fq
+    t : ENTERO
+        TAMAÑO MÁXIMO DEL SISTEMA
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    x : LISTA
+        SOLUCIÓN DEL SISTEMA DE HANKEL H_m x = (s_m, ..., s_{2m-1}), 
+        DONDE LA COLUMNA j DE H_m ES (s_j, ..., s_{j+m-1})
+    m : ENTERO
+        MAYOR m <= t CON H_m INVERTIBLE (0 SI NO HAY NINGUNO)
+
+    H_m es invertible si y solo si la complejidad lineal de los 2m 
+    primeros términos es m, y en ese caso el polinomio de conexión 
+    1 + c_1x + ... + c_mx^m de Berlekamp-Massey da x_j = -c_{m-j}. 
+    Una sola pasada de Berlekamp-Massey sirve para todos los m <= t
+
+    """
+    hist = Fqx.berlekamp_massey(s[:2*t], p, f, True)[2]
+    m = min(t, (len(hist)-1)//2)
+    while m>0 and hist[2*m][1] != m:
+        m -= 1
+    C = hist[2*m][0]
+    C = C + [Fq.neutro_ad(p, f)]*(m+1-len(C))
+    x = [Fq.inv_ad(C[m-j], p, f) for j in range(m)]
+    return x, m
+
 def rand(m, n, p, f):
     """
 
@@ -233,7 +567,7 @@ def rand(m, n, p, f):
         MATRIZ DE COEFICIENTES ALEATORIOS PERTENECIENTES A Fq
 
     """
-    A = neutro_ad(m, n, p)
+    A = neutro_ad(m, n, p, f)
     for i in range(m):
         for j in range(n):
             deg = random.randint(0, len(f)-2)
@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+"""
+IMPLEMENTACIÓN DE MATRICES CON COEFICIENTES EN Z/2Z EMPAQUETADAS EN BITS
+
+Consideraciones:
+    1) A = {"filas": [F0, F1, ..., F_{m-1}], "columnas": n} donde el
+    bit j del entero Fi es el elemento de la fila i y la columna j
+    2) Las conversiones con las listas de columnas de matricesZpZ
+    (p = 2) se hacen con a_gf2 y a_lista
+    3) La suma de filas es un XOR; mult y eliminacion_gaussiana usan el
+    método de los cuatro rusos con bloques de BLOQUE_M4R columnas
+"""
+
+import random
+
+# Número de columnas (filas de B en mult) que se agrupan en cada tabla
+# del método de los cuatro rusos (la tabla tiene 2^BLOQUE_M4R filas)
+BLOQUE_M4R = 8
+
+def a_gf2(A):
+    """
+
+    Parámetros
+    ----------
+    A : LISTA
+        MATRIZ DE matricesZpZ CON p = 2 (LISTA DE COLUMNAS)
+
+    Devuelve
+    --------
+    DICCIONARIO
+        LA MATRIZ A CON CADA FILA EMPAQUETADA EN UN ENTERO
+
+    """
+    n = len(A)
+    m = len(A[0]) if n > 0 else 0
+    filas = [0]*m
+    for j in range(n):
+        bit = 1 << j
+        for i in range(m):
+            if A[j][i] % 2 == 1:
+                filas[i] |= bit
+    return {"filas": filas, "columnas": n}
+
+def a_lista(A):
+    """
+
+    Parámetros
+    ----------
+    A : DICCIONARIO
+        MATRIZ
+
+    Devuelve
+    --------
+    LISTA
+        LA MATRIZ A COMO LISTA DE COLUMNAS (FORMATO DE matricesZpZ)
+
+    """
+    return [[(x >> j) & 1 for x in A["filas"]] \
+    for j in range(A["columnas"])]
+
+def neutro_ad(m, n):
+    """
+
+    Parámetros
+    ----------
+    m : ENTERO
+        NÚMERO DE FILAS DE LA MATRIZ
+    n : ENTERO
+        NÚMERO DE COLUMNAS DE LA MATRIZ
+
+    Devuelve
+    --------
+    DICCIONARIO
+        MATRIZ NEUTRO ADITIVO DE TAMAÑO m x n EN Z/2Z
+
+    """
+    return {"filas": [0]*m, "columnas": n}
+
+def neutro_mult(n):
+    """
+
+    Parámetros
+    ----------
+    n : ENTERO
+        NÚMERO DE FILAS Y COLUMNAS DE LA MATRIZ
+
+    Devuelve
+    --------
+    DICCIONARIO
+        MATRIZ NEUTRO MULTIPLICATIVO DE TAMAÑO n x n EN Z/2Z
+
+    """
+    return {"filas": [1 << i for i in range(n)], "columnas": n}
+
+def suma(A, B):
+    """
+
+    Parámetros
+    ----------
+    A : DICCIONARIO
+        MATRIZ
+    B : DICCIONARIO
+        MATRIZ
+
+    Devuelve
+    --------
+    DICCIONARIO
+        SUMA DE LAS MATRICES A Y B EN Z/2Z (XOR FILA A FILA)
+
+    """
+    return {"filas": [x ^ y for (x, y) in zip(A["filas"], B["filas"])], \
+    "columnas": A["columnas"]}
+
+def traspuesta(A):
+    """
+
+    Parámetros
+    ----------
+    A : DICCIONARIO
+        MATRIZ DE TAMAÑO m x n
+
+    Devuelve
+    --------
+    DICCIONARIO
+        MATRIZ TRASPUESTA DE A, DE TAMAÑO n x m
+
+    """
+    filas = A["filas"]
+    t = [0]*A["columnas"]
+    for i in range(len(filas)):
+        x = filas[i]
+        bit = 1 << i
+        while x > 0:
+            j = (x & -x).bit_length()-1
+            t[j] |= bit
+            x &= x-1
+    return {"filas": t, "columnas": len(filas)}
+
+def mult(A, B):
+    """
+
+    Parámetros
+    ----------
+    A : DICCIONARIO
+        MATRIZ DE TAMAÑO m x n
+    B : DICCIONARIO
+        MATRIZ DE TAMAÑO n x l
+
+    Devuelve
+    --------
+    DICCIONARIO
+        PRODUCTO DE LAS MATRICES A Y B EN Z/2Z, CALCULADO CON EL MÉTODO
+        DE LOS CUATRO RUSOS: PARA CADA BLOQUE DE BLOQUE_M4R FILAS DE B
+        SE TABULAN TODAS SUS COMBINACIONES Y CADA FILA DE A SOLO HACE
+        UNA CONSULTA A LA TABLA
+
+    """
+    filasA, filasB = A["filas"], B["filas"]
+    n = len(filasB)
+    prod = [0]*len(filasA)
+    for c in range(0, n, BLOQUE_M4R):
+        w = min(BLOQUE_M4R, n-c)
+        tabla = _tabla_combinaciones(filasB[c:c+w])
+        mascara = (1 << w)-1
+        for i in range(len(filasA)):
+            prod[i] ^= tabla[(filasA[i] >> c) & mascara]
+    return {"filas": prod, "columnas": B["columnas"]}
+
+def _tabla_combinaciones(filas):
+    """
+
+    Parámetros
+    ----------
+    filas : LISTA
+        FILAS EMPAQUETADAS F0, ..., F_{w-1}
+
+    Devuelve
+    --------
+    tabla : LISTA
+        tabla[s] ES LA SUMA DE LAS FILAS Fk CON EL BIT k DE s A 1
+
+    """
+    tabla = [0]*(1 << len(filas))
+    for s in range(1, len(tabla)):
+        bajo = s & -s
+        tabla[s] = tabla[s ^ bajo] ^ filas[bajo.bit_length()-1]
+    return tabla
+
+def _escalona(filas, n):
+    """
+
+    Parámetros
+    ----------
+    filas : LISTA
+        FILAS EMPAQUETADAS DE UNA MATRIZ (SE MODIFICAN)
+    n : ENTERO
+        NÚMERO DE COLUMNAS EN LAS QUE SE BUSCAN PIVOTES
+
+    Devuelve
+    --------
+    pivotes : LISTA
+        PARES (i, j) CON LA FILA Y LA COLUMNA DE CADA PIVOTE. AL
+        TERMINAR, filas ESTÁ EN FORMA ESCALONADA REDUCIDA SIN HABER
+        INTERCAMBIADO FILAS (EL MISMO RESULTADO QUE matricesZpZ)
+
+    """
+    m = len(filas)
+    libre = [True]*m
+    pivotes = []
+    for c in range(0, n, BLOQUE_M4R):
+        w = min(BLOQUE_M4R, n-c)
+        # Pivotes del bloque de columnas c, ..., c+w-1: cada fila
+        # candidata se reduce antes con los pivotes ya hallados en él
+        bloque = []
+        for j in range(c, c+w):
+            bit = 1 << j
+            for i in range(m):
+                if not libre[i]:
+                    continue
+                x = filas[i]
+                for (k, col) in bloque:
+                    if (x >> col) & 1:
+                        x ^= filas[k]
+                if x & bit:
+                    filas[i] = x
+                    for (k, col) in bloque:
+                        if filas[k] & bit:
+                            filas[k] ^= x
+                    libre[i] = False
+                    bloque.append((i, j))
+                    break
+        if len(bloque) == 0:
+            continue
+        # Tabla indexada por los w bits del bloque: a cada patrón le
+        # corresponde la combinación de filas pivote que anula sus bits
+        # en las columnas de los pivotes
+        comb = _tabla_combinaciones([filas[k] for (k, col) in bloque])
+        tabla = [0]*(1 << w)
+        for s in range(1, 1 << w):
+            idx = 0
+            for t in range(len(bloque)):
+                if (s >> (bloque[t][1]-c)) & 1:
+                    idx |= 1 << t
+            tabla[s] = comb[idx]
+        propias = set(k for (k, col) in bloque)
+        mascara = (1 << w)-1
+        for i in range(m):
+            if i not in propias:
+                filas[i] ^= tabla[(filas[i] >> c) & mascara]
+        pivotes += bloque
+    return pivotes
+
+def eliminacion_gaussiana(A):
+    """
+
+    Parámetros
+    ----------
+    A : DICCIONARIO
+        MATRIZ
+
+    Devuelve
+    --------
+    DICCIONARIO
+        MATRIZ RESULTANTE DE APLICAR LA ELIMINACIÓN GAUSSIANA
+        A LA MATRIZ A EN Z/2Z (SIN MODIFICAR A)
+
+    """
+    filas = list(A["filas"])
+    _escalona(filas, A["columnas"])
+    return {"filas": filas, "columnas": A["columnas"]}
+
+def rango(A):
+    """
+
+    Parámetros
+    ----------
+    A : DICCIONARIO
+        MATRIZ
+
+    Devuelve
+    --------
+    ENTERO
+        RANGO DE LA MATRIZ A EN Z/2Z (SIN MODIFICAR A)
+
+    """
+    return len(_escalona(list(A["filas"]), A["columnas"]))
+
+def det(A):
+    """
+
+    Parámetros
+    ----------
+    A : DICCIONARIO
+        MATRIZ CUADRADA
+
+    Devuelve
+    --------
+    ENTERO
+        DETERMINANTE DE LA MATRIZ A EN Z/2Z (1 SI Y SOLO SI A TIENE
+        RANGO MÁXIMO)
+
+    """
+    if rango(A) == A["columnas"]:
+        return 1
+    return 0
+
+def resuelve(A, b):
+    """
+
+    Parámetros
+    ----------
+    A : DICCIONARIO
+        MATRIZ DE TAMAÑO m x n
+    b : LISTA
+        VECTOR DE m TÉRMINOS INDEPENDIENTES EN Z/2Z
+
+    Devuelve
+    --------
+    LISTA
+        VECTOR DE n ELEMENTOS DE Z/2Z SOLUCIÓN DE Ax = b (CON LAS
+        VARIABLES LIBRES A CERO), None SI EL SISTEMA ES INCOMPATIBLE
+
+    """
+    return resuelve_varios(A, a_gf2([b]))[0]
+
+def resuelve_varios(A, B):
+    """
+
+    Parámetros
+    ----------
+    A : DICCIONARIO
+        MATRIZ DE TAMAÑO m x n
+    B : DICCIONARIO
+        MATRIZ DE TAMAÑO m x l CUYAS COLUMNAS SON LOS VECTORES DE
+        TÉRMINOS INDEPENDIENTES
+
+    Devuelve
+    --------
+    sols : LISTA
+        SOLUCIONES DE Ax = b PARA CADA COLUMNA b DE B (None PARA LOS
+        SISTEMAS INCOMPATIBLES), CON UNA SOLA ELIMINACIÓN SOBRE LA
+        MATRIZ AMPLIADA [A | B]
+
+    """
+    n = A["columnas"]
+    filas = [x | (y << n) for (x, y) in zip(A["filas"], B["filas"])]
+    pivotes = _escalona(filas, n)
+    usadas = set(i for (i, j) in pivotes)
+    # Las filas sin pivote ya son nulas en A; un 1 en la parte de B
+    # indica que ese sistema es incompatible
+    incompatibles = 0
+    for i in range(len(filas)):
+        if i not in usadas:
+            incompatibles |= filas[i] >> n
+    sols = []
+    for k in range(B["columnas"]):
+        if (incompatibles >> k) & 1:
+            sols.append(None)
+            continue
+        x = [0]*n
+        for (i, j) in pivotes:
+            x[j] = (filas[i] >> (n+k)) & 1
+        sols.append(x)
+    return sols
+
+def nucleo(A):
+    """
+
+    Parámetros
+    ----------
+    A : DICCIONARIO
+        MATRIZ DE TAMAÑO m x n
+
+    Devuelve
+    --------
+    DICCIONARIO
+        MATRIZ CUYAS FILAS SON UNA BASE DEL NÚCLEO {x : Ax = 0} EN
+        Z/2Z (SI A ES UNA MATRIZ GENERADORA, ES UNA MATRIZ DE CONTROL)
+
+    """
+    n = A["columnas"]
+    filas = list(A["filas"])
+    pivotes = _escalona(filas, n)
+    cols = set(j for (i, j) in pivotes)
+    base = []
+    for l in range(n):
+        if l in cols:
+            continue
+        # Variable libre l = 1, las demás libres a 0
+        x = 1 << l
+        for (i, j) in pivotes:
+            if (filas[i] >> l) & 1:
+                x |= 1 << j
+        base.append(x)
+    return {"filas": base, "columnas": n}
+
+def rand(m, n):
+    """
+
+    Parámetros
+    ----------
+    m : ENTERO
+        NÚMERO DE FILAS DE LA MATRIZ
+    n : ENTERO
+        NÚMERO DE COLUMNAS DE LA MATRIZ
+
+    Devuelve
+    -------
+    DICCIONARIO
+        MATRIZ DE COEFICIENTES ALEATORIOS PERTENECIENTES A Z/2Z
+
+    """
+    return {"filas": [random.getrandbits(n) for i in range(m)], \
+    "columnas": n}
\ No newline at end of file
@@ -6,7 +6,6 @@ Consideraciones:
     1) A = [A0, A1, ..., An] donde Ai son vectores columna
 """
 
-from copy import deepcopy
 import cuerpoZpZ as ZpZ
 
 def neutro_ad(m, n, p):
@@ -133,6 +132,34 @@ def mult(A, B, p):
 def det(A, p):
     """
 
+    Parámetros
+    ----------
+    A : LISTA
+        MATRIZ CUADRADA
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    d : ENTERO
+        DETERMINANTE DE LA MATRIZ A EN Z/pZ, CALCULADO COMO EL PRODUCTO 
+        DE LOS PIVOTES DE SU FACTORIZACIÓN LU (SIN MODIFICAR A)
+
+    """
+    n = len(A)
+    F = lu(A, p)
+    if len(F["pivotes"]) < n:
+        return ZpZ.neutro_ad(p)
+    d = ZpZ.neutro_mult(p)
+    if F["signo"] == -1:
+        d = ZpZ.inv_ad(d, p)
+    for k in range(n):
+        d = ZpZ.mult(d, F["U"][k][k], p)
+    return d
+
+def rango(A, p):
+    """
+
     Parámetros
     ----------
     A : LISTA
@@ -143,25 +170,144 @@ def det(A, p):
     Devuelve
     --------
     ENTERO
-        DETERMINANTE DE LA MATRIZ A EN Z/pZ
-
-    """
-    if len(A) == 1:
-        return A[0][0]
-    if len(A) == 2:
-        return ZpZ.suma(ZpZ.mult(A[0][0], A[1][1], p), \
-        ZpZ.inv_ad(ZpZ.mult(A[0][1], A[1][0], p), p), p)
-    det_val = ZpZ.neutro_ad(p)
-    for j in range(len(A)):
-        B = deepcopy(A)
-        B.pop(j)
-        for k in range(len(B)):
-            B[k] = B[k][1:]
-        cofactor = det(B, p)
-        if j % 2 == 1:
-            cofactor = ZpZ.inv_ad(cofactor, p)  
-        det_val = ZpZ.suma(det_val, ZpZ.mult(A[j][0], cofactor, p), p)
-    return det_val
+        RANGO DE LA MATRIZ A EN Z/pZ (SIN MODIFICAR A)
+
+    """
+    return len(lu(A, p)["pivotes"])
+
+def lu(A, p):
+    """
+
+    Parámetros
+    ----------
+    A : LISTA
+        MATRIZ DE TAMAÑO m x n
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    F : DICCIONARIO
+        FACTORIZACIÓN PA = LU DE A EN Z/pZ, CON LAS CLAVES "L" (MATRIZ 
+        m x m TRIANGULAR INFERIOR CON UNOS EN LA DIAGONAL), "U" (MATRIZ 
+        m x n ESCALONADA), "perm" (LA FILA i DE PA ES LA FILA perm[i] 
+        DE A), "pivotes" (COLUMNAS DE LOS PIVOTES DE U) Y "signo" 
+        (SIGNO DE LA PERMUTACIÓN P). LA MATRIZ A NO SE MODIFICA
+
+    """
+    n = len(A)
+    m = len(A[0]) if n > 0 else 0
+    cero = ZpZ.neutro_ad(p)
+    # Trabajamos por filas sobre una copia de A
+    U = [[A[j][i] for j in range(n)] for i in range(m)]
+    L = [[cero]*m for i in range(m)]
+    perm = list(range(m))
+    signo = 1
+    pivotes = []
+    r = 0
+    for j in range(n):
+        if r == m:
+            break
+        i = r
+        while i<m and U[i][j] == cero:
+            i += 1
+        if i == m:
+            continue
+        if i != r:
+            U[i], U[r] = U[r], U[i]
+            L[i], L[r] = L[r], L[i]
+            perm[i], perm[r] = perm[r], perm[i]
+            signo = -signo
+        inv = ZpZ.inv_mult(U[r][j], p)
+        for i in range(r+1, m):
+            if U[i][j] != cero:
+                factor = ZpZ.mult(U[i][j], inv, p)
+                L[i][r] = factor
+                factor = ZpZ.inv_ad(factor, p)
+                for k in range(j, n):
+                    U[i][k] = ZpZ.suma(U[i][k], \
+                    ZpZ.mult(factor, U[r][k], p), p)
+        pivotes.append(j)
+        r += 1
+    for i in range(m):
+        L[i][i] = ZpZ.neutro_mult(p)
+    # Devolvemos L y U por columnas
+    return {"L": [[L[i][j] for i in range(m)] for j in range(m)], \
+    "U": [[U[i][j] for i in range(m)] for j in range(n)], \
+    "perm": perm, "pivotes": pivotes, "signo": signo}
+
+def resuelve(F, b, p, libres=None):
+    """
+
+    Parámetros
+    ----------
+    F : DICCIONARIO
+        FACTORIZACIÓN LU DE UNA MATRIZ A DE TAMAÑO m x n, 
+        OBTENIDA CON lu(A, p)
+    b : LISTA
+        VECTOR DE m TÉRMINOS INDEPENDIENTES
+    p : ENTERO
+        PRIMO
+    libres : ENTERO, OPCIONAL
+        VALOR QUE SE DA A LAS VARIABLES LIBRES (CERO POR DEFECTO)
+
+    Devuelve
+    --------
+    x : LISTA
+        VECTOR DE n ELEMENTOS DE Z/pZ SOLUCIÓN DE Ax = b, 
+        None SI EL SISTEMA ES INCOMPATIBLE
+
+    """
+    L, U, pivotes = F["L"], F["U"], F["pivotes"]
+    m = len(F["perm"])
+    n = len(U)
+    cero = ZpZ.neutro_ad(p)
+    if libres is None:
+        libres = cero
+    # Ly = Pb
+    y = [b[F["perm"][i]] for i in range(m)]
+    for j in range(m):
+        if y[j] != cero:
+            for i in range(j+1, m):
+                if L[j][i] != cero:
+                    y[i] = ZpZ.suma(y[i], \
+                    ZpZ.inv_ad(ZpZ.mult(L[j][i], y[j], p), p), p)
+    r = len(pivotes)
+    for i in range(r, m):
+        if y[i] != cero:
+            return None
+    # Ux = y, empezando por el último pivote
+    x = [libres]*n
+    for k in range(r-1, -1, -1):
+        c = pivotes[k]
+        s = y[k]
+        for j in range(c+1, n):
+            if U[j][k] != cero and x[j] != cero:
+                s = ZpZ.suma(s, ZpZ.inv_ad(ZpZ.mult(U[j][k], x[j], p), p), p)
+        x[c] = ZpZ.mult(s, ZpZ.inv_mult(U[c][k], p), p)
+    return x
+
+def resuelve_varios(F, B, p):
+    """
+
+    Parámetros
+    ----------
+    F : DICCIONARIO
+        FACTORIZACIÓN LU DE UNA MATRIZ A, OBTENIDA CON lu(A, p)
+    B : LISTA
+        MATRIZ CUYAS COLUMNAS SON LOS VECTORES DE TÉRMINOS 
+        INDEPENDIENTES
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    LISTA
+        SOLUCIONES DE Ax = b PARA CADA COLUMNA b DE B (None PARA LOS 
+        SISTEMAS INCOMPATIBLES), REUTILIZANDO LA MISMA FACTORIZACIÓN
+
+    """
+    return [resuelve(F, b, p) for b in B]
 
 def eliminacion_gaussiana(A, p):
     """
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""
+IMPLEMENTACIÓN DE MATRICES CON COEFICIENTES EN Z/pZ SOBRE NUMPY
+
+Consideraciones:
+    1) A es un array de NumPy de tamaño m x n guardado por filas
+    (A[i, j] es el elemento de la fila i y la columna j) con
+    coeficientes en {0, 1, ..., p-1}
+    2) Las conversiones con las listas de columnas de matricesZpZ
+    se hacen con a_numpy y a_lista
+    3) Si (p-1)^2 no cabe en un entero de 64 bits se trabaja con
+    enteros de Python (dtype object)
+"""
+
+import numpy as np
+import cuerpoZpZ as ZpZ
+
+# Número máximo de columnas de cada bloque de mult (además del límite
+# que impone el tamaño de p para que la suma no desborde)
+BLOQUE_MULT = 256
+
+def _tipo(p):
+    """
+
+    Parámetros
+    ----------
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    TIPO DE NUMPY
+        np.int64 SI (p-1)^2 CABE EN UN ENTERO DE 64 BITS, object SI NO
+
+    """
+    if (p-1)**2 < 2**63:
+        return np.int64
+    return object
+
+def a_numpy(A, p):
+    """
+
+    Parámetros
+    ----------
+    A : LISTA
+        MATRIZ DE matricesZpZ (LISTA DE COLUMNAS)
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    ARRAY
+        LA MATRIZ A COMO ARRAY CONTIGUO GUARDADO POR FILAS
+
+    """
+    if len(A) == 0:
+        return np.zeros((0, 0), dtype=_tipo(p))
+    M = np.array(A, dtype=_tipo(p)).T % p
+    return np.ascontiguousarray(M)
+
+def a_lista(M):
+    """
+
+    Parámetros
+    ----------
+    M : ARRAY
+        MATRIZ
+
+    Devuelve
+    --------
+    LISTA
+        LA MATRIZ M COMO LISTA DE COLUMNAS (FORMATO DE matricesZpZ)
+
+    """
+    return [[int(x) for x in col] for col in M.T]
+
+def neutro_ad(m, n, p):
+    """
+
+    Parámetros
+    ----------
+    m : ENTERO
+        NÚMERO DE FILAS DE LA MATRIZ
+    n : ENTERO
+        NÚMERO DE COLUMNAS DE LA MATRIZ
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    ARRAY
+        MATRIZ NEUTRO ADITIVO DE TAMAÑO m x n EN Z/pZ
+
+    """
+    return np.zeros((m, n), dtype=_tipo(p))
+
+def neutro_mult(n, p):
+    """
+
+    Parámetros
+    ----------
+    n : ENTERO
+        NÚMERO DE FILAS Y COLUMNAS DE LA MATRIZ
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    ARRAY
+        MATRIZ NEUTRO MULTIPLICATIVO DE TAMAÑO n x n EN Z/pZ
+
+    """
+    M = np.zeros((n, n), dtype=_tipo(p))
+    for i in range(n):
+        M[i, i] = 1
+    return M
+
+def suma(A, B, p):
+    """
+
+    Parámetros
+    ----------
+    A : ARRAY
+        MATRIZ
+    B : ARRAY
+        MATRIZ
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    ARRAY
+        SUMA DE LAS MATRICES A Y B EN Z/pZ
+
+    """
+    return (A + B) % p
+
+def inv_ad(A, p):
+    """
+
+    Parámetros
+    ----------
+    A : ARRAY
+        MATRIZ
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    ARRAY
+        MATRIZ INVERSA ADITIVA DE LA MATRIZ A EN Z/pZ
+
+    """
+    return (-A) % p
+
+def mult(A, B, p):
+    """
+
+    Parámetros
+    ----------
+    A : ARRAY
+        MATRIZ DE TAMAÑO m x n
+    B : ARRAY
+        MATRIZ DE TAMAÑO n x l
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    prod : ARRAY
+        PRODUCTO DE LAS MATRICES A Y B EN Z/pZ, CALCULADO POR BLOQUES
+        DE COLUMNAS DE A (FILAS DE B) TAN GRANDES COMO PERMITE p PARA
+        QUE LA SUMA DE PRODUCTOS NO DESBORDE, REDUCIENDO MÓDULO p UNA
+        SOLA VEZ POR BLOQUE
+
+    """
+    m, n = A.shape
+    l = B.shape[1]
+    prod = np.zeros((m, l), dtype=_tipo(p))
+    if _tipo(p) is object:
+        bloque = max(n, 1)
+    else:
+        bloque = max(1, min(BLOQUE_MULT, (2**63-1)//max((p-1)**2, 1)))
+    for k in range(0, n, bloque):
+        prod += np.dot(A[:, k:k+bloque], B[k:k+bloque, :]) % p
+        prod %= p
+    return prod
+
+def det(A, p):
+    """
+
+    Parámetros
+    ----------
+    A : ARRAY
+        MATRIZ CUADRADA
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    d : ENTERO
+        DETERMINANTE DE LA MATRIZ A EN Z/pZ (SIN MODIFICAR A)
+
+    """
+    M = A.copy() % p
+    n = M.shape[0]
+    d = 1
+    for j in range(n):
+        filas = np.nonzero(M[j:, j])[0]
+        if len(filas) == 0:
+            return 0
+        i = j + int(filas[0])
+        if i != j:
+            M[[i, j]] = M[[j, i]]
+            d = -d
+        piv = int(M[j, j])
+        d = d*piv % p
+        # Eliminamos por debajo del pivote todas las filas a la vez
+        factores = M[j+1:, j] * pow(piv, -1, p) % p
+        M[j+1:, j:] = (M[j+1:, j:] - factores[:, None] * M[j, j:]) % p
+    return d % p
+
+def rango(A, p):
+    """
+
+    Parámetros
+    ----------
+    A : ARRAY
+        MATRIZ
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    ENTERO
+        RANGO DE LA MATRIZ A EN Z/pZ (SIN MODIFICAR A)
+
+    """
+    E = eliminacion_gaussiana(A, p)
+    return int(np.count_nonzero(E.any(axis=1)))
+
+def eliminacion_gaussiana(A, p):
+    """
+
+    Parámetros
+    ----------
+    A : ARRAY
+        MATRIZ
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    --------
+    M : ARRAY
+        MATRIZ RESULTANTE DE APLICAR LA ELIMINACIÓN GAUSSIANA
+        A LA MATRIZ A EN Z/pZ (LA MISMA QUE matricesZpZ, PERO SIN
+        MODIFICAR A), CON LAS OPERACIONES DE FILAS VECTORIZADAS
+
+    """
+    M = A.copy() % p
+    m, n = M.shape
+    libre = np.ones(m, dtype=bool)
+    for j in range(n):
+        filas = np.nonzero((M[:, j] != 0) & libre)[0]
+        if len(filas) == 0:
+            continue
+        i = int(filas[0])
+        libre[i] = False
+        M[i, j:] = M[i, j:] * pow(int(M[i, j]), -1, p) % p
+        # Anulamos la columna j en el resto de filas a la vez
+        factores = M[:, j].copy()
+        factores[i] = 0
+        M[:, j:] = (M[:, j:] - factores[:, None] * M[i, j:]) % p
+    return M
+
+def rand(m, n, p):
+    """
+
+    Parámetros
+    ----------
+    m : ENTERO
+        NÚMERO DE FILAS DE LA MATRIZ
+    n : ENTERO
+        NÚMERO DE COLUMNAS DE LA MATRIZ
+    p : ENTERO
+        PRIMO
+
+    Devuelve
+    -------
+    ARRAY
+        MATRIZ DE COEFICIENTES ALEATORIOS PERTENECIENTES A Z/pZ
+
+    """
+    if _tipo(p) is object:
+        A = neutro_ad(m, n, p)
+        for i in range(m):
+            for j in range(n):
+                A[i, j] = ZpZ.rand(p)
+        return A
+    return np.random.randint(0, p, size=(m, n), dtype=np.int64)
\ No newline at end of file
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+RAÍCES DE POLINOMIOS DE GRADO PEQUEÑO EN Fq[x]
+
+Consideraciones:
+    1) f debe ser mónico e irreducible y Fq debe tener tablas exp/log
+    (ver Fq.tablas), pues se trabaja con los elementos codificados
+    como enteros
+    2) Grado 1 y 2 para cualquier p; grado 3 y 4 solo si p = 2,
+    reduciéndolos a polinomios afines x^4 + c2x^2 + c1x + c0
+    3) En los demás casos las funciones devuelven None y hay que
+    recurrir a la búsqueda de Chien
+"""
+
+import cuerpoFq as Fq
+import cuerpoFqEntero as FqE
+
+# Grado máximo de los polinomios que se resuelven de forma directa
+GRADO_MAX = 4
+
+# Tablas y -> y^2 + y invertidas para las cuadráticas en
+# característica 2, indexadas por (p, f)
+_tablas_cuadraticas = {}
+
+def raices(g, p, f):
+    """
+
+    Parámetros
+    ----------
+    g : LISTA
+        POLINOMIO DE ((Z/pZ)[x]/<f>)[x] DE GRADO A LO SUMO GRADO_MAX
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    LISTA
+        RAÍCES DISTINTAS DE g EN (Z/pZ)[x]/<f>,
+        None SI NO SE PUEDEN CALCULAR DE FORMA DIRECTA
+
+    """
+    g = [Fq.a_entero(c, p, f) for c in g]
+    while len(g) > 0 and g[len(g)-1] == 0:
+        g.pop(len(g)-1)
+    grado = len(g)-1
+    if grado < 0 or grado > GRADO_MAX or Fq.tablas(p, f) is None:
+        return None
+    if grado == 0:
+        return []
+    # Hacemos g mónico
+    inv = FqE.inv_mult(g[grado], p, f)
+    a = [FqE.mult(c, inv, p, f) for c in g]
+    if grado == 1:
+        r = [FqE.inv_ad(a[0], p, f)]
+    elif grado == 2:
+        r = _raices_cuadratica(a[1], a[0], p, f)
+    elif p != 2:
+        return None
+    elif grado == 3:
+        r = _raices_cubica(a[2], a[1], a[0], p, f)
+    else:
+        r = _raices_cuartica(a[3], a[2], a[1], a[0], p, f)
+    return [Fq.a_lista(x, p, f) for x in sorted(set(r))]
+
+def _raices_cuadratica(b, c, p, f):
+    """
+
+    Parámetros
+    ----------
+    b : ENTERO
+        COEFICIENTE DE x
+    c : ENTERO
+        TÉRMINO INDEPENDIENTE
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    LISTA
+        RAÍCES (COMO ENTEROS) DE x^2 + bx + c
+
+    """
+    if p != 2:
+        # x = (-b +- sqrt(b^2-4c))/2, con la raíz cuadrada
+        # obtenida de la tabla de logaritmos
+        tab = Fq.tablas(p, f)
+        exp, log = tab[0], tab[1]
+        disc = FqE.suma(FqE.mult(b, b, p, f), \
+        FqE.inv_ad(FqE.mult(4 % p, c, p, f), p, f), p, f)
+        if disc == 0:
+            s = 0
+        elif log[disc] % 2 == 1:
+            return []
+        else:
+            s = exp[log[disc]//2]
+        medio = FqE.inv_mult(2, p, f)
+        menos_b = FqE.inv_ad(b, p, f)
+        menos_s = FqE.inv_ad(s, p, f)
+        return [FqE.mult(FqE.suma(menos_b, s, p, f), medio, p, f), \
+        FqE.mult(FqE.suma(menos_b, menos_s, p, f), medio, p, f)]
+    if b == 0:
+        # x^2 = c tiene como única raíz c^{q/2}
+        q = p**(len(f)-1)
+        return [FqE.potencia(c, q//2, p, f)]
+    # Con x = by queda y^2 + y = c/b^2, que se resuelve con la tabla
+    u = FqE.mult(c, FqE.inv_mult(FqE.mult(b, b, p, f), p, f), p, f)
+    tabla = _tabla_cuadratica(p, f)
+    if u not in tabla:
+        return []
+    y = tabla[u]
+    return [FqE.mult(b, y, p, f), FqE.mult(b, y ^ 1, p, f)]
+
+def _tabla_cuadratica(p, f):
+    """
+
+    Parámetros
+    ----------
+    p : ENTERO
+        PRIMO (p = 2)
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    DICCIONARIO
+        A CADA VALOR u = y^2 + y LE ASOCIA UNA DE SUS DOS
+        PREIMÁGENES y (LA OTRA ES y + 1)
+
+    """
+    clave = (p, tuple(f))
+    if clave not in _tablas_cuadraticas:
+        q = p**(len(f)-1)
+        tabla = {}
+        for y in range(q):
+            tabla[FqE.mult(y, y, p, f) ^ y] = y
+        _tablas_cuadraticas[clave] = tabla
+    return _tablas_cuadraticas[clave]
+
+def _raices_cubica(a, b, c, p, f):
+    """
+
+    Parámetros
+    ----------
+    a, b, c : ENTEROS
+        COEFICIENTES DE x^3 + ax^2 + bx + c, CON p = 2
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    LISTA
+        RAÍCES (COMO ENTEROS) DE x^3 + ax^2 + bx + c
+
+    """
+    # Con x = y + a queda y^3 + ey + h, y multiplicando por y
+    # se obtiene el polinomio afín y^4 + ey^2 + hy
+    e = FqE.mult(a, a, p, f) ^ b
+    h = FqE.mult(a, b, p, f) ^ c
+    ys = _raices_afin(e, h, 0, p, f)
+    return [y ^ a for y in ys if y != 0 or h == 0]
+
+def _raices_cuartica(a3, a2, a1, a0, p, f):
+    """
+
+    Parámetros
+    ----------
+    a3, a2, a1, a0 : ENTEROS
+        COEFICIENTES DE x^4 + a3x^3 + a2x^2 + a1x + a0, CON p = 2
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    LISTA
+        RAÍCES (COMO ENTEROS) DE x^4 + a3x^3 + a2x^2 + a1x + a0
+
+    """
+    if a3 == 0:
+        return _raices_afin(a2, a1, a0, p, f)
+    # Con x = y + d, d = sqrt(a1/a3), desaparece el término en y:
+    # y^4 + a3y^3 + b2y^2 + b0
+    q = p**(len(f)-1)
+    d = FqE.mult(a1, FqE.inv_mult(a3, p, f), p, f)
+    d = FqE.potencia(d, q//2, p, f)
+    b2 = FqE.mult(a3, d, p, f) ^ a2
+    b0 = 0
+    for c in [1, a3, a2, a1, a0]:
+        b0 = FqE.mult(b0, d, p, f) ^ c
+    if b0 == 0:
+        ys = [0] + _raices_cubica(a3, b2, 0, p, f)
+    else:
+        # Con y = 1/z queda el polinomio afín
+        # z^4 + (b2/b0)z^2 + (a3/b0)z + 1/b0
+        inv = FqE.inv_mult(b0, p, f)
+        zs = _raices_afin(FqE.mult(b2, inv, p, f), \
+        FqE.mult(a3, inv, p, f), inv, p, f)
+        ys = [FqE.inv_mult(z, p, f) for z in zs]
+    return [y ^ d for y in ys]
+
+def _raices_afin(c2, c1, c0, p, f):
+    """
+
+    Parámetros
+    ----------
+    c2, c1, c0 : ENTEROS
+        COEFICIENTES DE x^4 + c2x^2 + c1x + c0, CON p = 2
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    sols : LISTA
+        RAÍCES (COMO ENTEROS) DE x^4 + c2x^2 + c1x + c0, OBTENIDAS
+        RESOLVIENDO EL SISTEMA LINEAL SOBRE Z/2Z L(x) = c0,
+        SIENDO L(x) = x^4 + c2x^2 + c1x
+
+    """
+    n = len(f)-1
+    # Eliminación gaussiana sobre las imágenes L(x^k) de la base,
+    # guardando en cada fila la combinación de la base que la produce
+    filas = []
+    nucleo = []
+    for k in range(n):
+        v = 1 << k
+        v2 = FqE.mult(v, v, p, f)
+        imagen = FqE.mult(v2, v2, p, f) ^ FqE.mult(c2, v2, p, f) \
+        ^ FqE.mult(c1, v, p, f)
+        comb = v
+        for (fv, fc, bit) in filas:
+            if (imagen >> bit) & 1:
+                imagen ^= fv
+                comb ^= fc
+        if imagen == 0:
+            nucleo.append(comb)
+        else:
+            filas.append((imagen, comb, imagen.bit_length()-1))
+    # Solución particular de L(x) = c0
+    x = 0
+    for (fv, fc, bit) in filas:
+        if (c0 >> bit) & 1:
+            c0 ^= fv
+            x ^= fc
+    if c0 != 0:
+        return []
+    sols = [x]
+    for v in nucleo:
+        sols = sols + [s ^ v for s in sols]
+    return sols
@@ -4,11 +4,21 @@ CÓDIGOS DE REED-SOLOMON - VERSIÓN BCH
 """
 
 import cuerpoFq as Fq
+import cuerpoFqEntero as FqE
 import anilloFqx as Fqx
 import matricesFq as mat
-from copy import deepcopy
+import raicesFq as rfq
 
-def calcula_Mt_vt(k, n, alpha, i, r, t, p, f):
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Exponentes de las matrices de potencias alpha^{(i+j)l} usadas por 
+# calcula_sindromes_bloques, indexadas por (q-1, log(alpha), i, n, m)
+_potencias_sindromes = {}
+
+def calcula_Mt_vt(k, n, alpha, i, r, t, p, f, S=None):
     """
 
     Parámetros
@@ -29,6 +39,8 @@ def calcula_Mt_vt(k, n, alpha, i, r, t, p, f):
         PRIMO
     f : LISTA
         POLINOMIO
+    S : LISTA, OPCIONAL
+        LOS 2t SÍNDROMES DE r(x), SI YA SE HAN CALCULADO
 
     Devuelve
     --------
@@ -41,32 +53,29 @@ def calcula_Mt_vt(k, n, alpha, i, r, t, p, f):
 
     """
     
-    # Calculamos la potencia alpha^i
-    alpha_i = Fq.potencia(alpha, i, p, f)
-    
     # Calculamos simultáneamente las potencias de alpha 
     # y las evaluamos en el polinomio r(x), lo cual es 
     # equivalente a evaluar en el polinomio e(x)
-    e_alphas = [Fqx.evalua(r, alpha_i, p, f)]
-    for j in range(1, 2*t):
-        alpha_i = Fq.mult(alpha_i, alpha, p, f)
-        e_alphas.append(Fqx.evalua(r, alpha_i, p, f))
+    if S is None:
+        e_alphas = calcula_sindromes(alpha, i, r, max(2*t, 1), p, f)
+    else:
+        e_alphas = S[:max(2*t, 1)]
+    
+    # Bajamos t hasta el mayor valor con M_t invertible, que se 
+    # obtiene de una sola pasada sobre los síndromes
+    t = mat.resuelve_hankel(e_alphas, t, p, f)[1]
+    e_alphas = e_alphas[:max(2*t, 1)]
         
     # Construimos la matriz M_t y el vector v_t
     Mt = mat.neutro_ad(t, t, p, f)
     for j in range(0, t):
         Mt[j] = e_alphas[j:t+j]
     vt = e_alphas[-t:]
-    
-    # Si la matriz tiene determinante nulo, bajamos t 
-    # una unidad hasta encontrar el adecuado
-    if mat.det(Mt, p, f) == Fq.neutro_ad(p, f) and t!= 0:
-        t = t-1
-        Mt, vt, t = calcula_Mt_vt(k, n, alpha, i, r, t, p, f)
         
     return Mt, vt, t
 
-def rs_bch(k, n, alpha, i, g, r, p, f):
+def rs_bch(k, n, alpha, i, g, r, p, f, localizador="pgz", \
+magnitudes="sistema", sindromes=None):
     """
 
     Parámetros
@@ -79,12 +88,24 @@ def rs_bch(k, n, alpha, i, g, r, p, f):
         GENERADOR DE Fq*
     i : ENTERO
         POTENCIA
+    g : LISTA
+        POLINOMIO GENERADOR DEL CÓDIGO
     r : LISTA
         POLINOMIO RECIBIDO POR EL CANAL CON RUIDO
     p : ENTERO
         PRIMO
     f : LISTA
         POLINOMIO
+    localizador : CADENA, OPCIONAL
+        MÉTODO PARA HALLAR EL POLINOMIO LOCALIZADOR: "pgz" RESUELVE EL 
+        SISTEMA DE LOS SÍNDROMES Y "bm" USA BERLEKAMP-MASSEY
+    magnitudes : CADENA, OPCIONAL
+        MÉTODO PARA HALLAR LOS VALORES DE LOS ERRORES: "sistema" RESUELVE 
+        EL SISTEMA DE LAS POTENCIAS DE LOS alpha^{beta} Y "forney" 
+        APLICA LA FÓRMULA DE FORNEY
+    sindromes : LISTA, OPCIONAL
+        LOS 2t SÍNDROMES DE r(x), SI YA SE HAN CALCULADO (POR EJEMPLO 
+        PARA TODOS LOS BLOQUES A LA VEZ CON calcula_sindromes_bloques)
 
     Devuelve
     -------
@@ -94,47 +115,176 @@ def rs_bch(k, n, alpha, i, g, r, p, f):
 
     """
     
-    # Valor de t inicial, tomamos el máximo
-    t0 = (n-k)//2
-    Mt, vt, t = calcula_Mt_vt(k, n, alpha, i, r, t0, p, f)
+    # Si todos los síndromes son nulos, r(x) es una palabra del código
+    S = sindromes
+    if S is None:
+        t0 = (n-k)//2
+        S = calcula_sindromes(alpha, i, r, 2*t0, p, f)
+    if all(x == Fq.neutro_ad(p, f) for x in S):
+        return Fqx.div(r, g, p, f)[0]
+    
+    # Calculamos el polinomio localizador w(x) y el número de errores t
+    if localizador == "bm":
+        w, t = localizador_bm(k, n, alpha, i, r, p, f, S)
+    elif localizador == "pgz":
+        w, t = localizador_pgz(k, n, alpha, i, r, p, f, S)
+    else:
+        raise ValueError("Localizador desconocido: " + str(localizador))
+    
+    # Hallamos las raíces de w(x) que son los beta_{i}
+    betas = localiza_raices(w, alpha, n, p, f)
     
-    # Aplicamos la eliminación gaussiana
-    A = mat.eliminacion_gaussiana(Mt+[vt], p, f)
-    new_Mt = A[:t]
-    new_vt = A[len(A)-1]
+    # Hallamos los valores de los errores en las posiciones beta_{i}
+    if magnitudes == "forney":
+        e_coefs = magnitudes_forney(alpha, i, r, w, t, betas, p, f, S)
+    elif magnitudes == "sistema":
+        e_coefs = magnitudes_sistema(alpha, i, r, t, betas, p, f, S)
+    else:
+        raise ValueError("Método desconocido: " + str(magnitudes))
     
-    # Calculamos la solución del sistema que son
-    # los coeficientes [w0, w1, ..., w_{t-1}]
-    coefs = deepcopy(new_vt)
+    # Obtenemos el polinomio e
+    if len(betas) == 0:
+        e = Fqx.neutro_ad(p, f)
+    else:
+        e = [Fq.neutro_ad(p, f)]*(betas[len(betas)-1]+1)
+        for k in range(len(betas)):
+            e[betas[k]] = e_coefs[k]
     
-    for j in range(0, len(new_Mt)):
-        for s in range(0, len(new_Mt[0])):
-            if new_Mt[j][s] == Fq.neutro_mult(p, f):
-                coefs[s] = new_vt[j]
+    #Recuperamos c y, con él, recuperamos s
+    c = Fqx.suma(r, Fqx.inv_ad(e, p, f), p, f)
+    s = Fqx.div(c, g, p, f)[0]
+    
+    return s
+
+def localizador_pgz(k, n, alpha, i, r, p, f, S=None):
+    """
+
+    Parámetros
+    ----------
+    k : ENTERO
+        DIMENSIÓN DEL CÓDIGO BCH
+    n : ENTERO
+        LONGITUD DEL CÓDIGO BCH
+    alpha : LISTA
+        GENERADOR DE Fq*
+    i : ENTERO
+        POTENCIA
+    r : LISTA
+        POLINOMIO RECIBIDO POR EL CANAL CON RUIDO
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+    S : LISTA, OPCIONAL
+        LOS 2t SÍNDROMES DE r(x), SI YA SE HAN CALCULADO
+
+    Devuelve
+    --------
+    w : LISTA
+        POLINOMIO LOCALIZADOR MÓNICO CUYAS RAÍCES SON LAS alpha^{beta} 
+        DE LAS POSICIONES beta DE LOS ERRORES, OBTENIDO RESOLVIENDO 
+        EL SISTEMA M_t w = v_t
+    t : ENTERO
+        NÚMERO DE ERRORES OCURRIDOS
+
+    """
+    
+    # Valor de t inicial, tomamos el máximo
+    t0 = (n-k)//2
+    if S is None:
+        S = calcula_sindromes(alpha, i, r, 2*t0, p, f)
+    
+    # Mayor t <= t0 con M_t invertible y solución del sistema 
+    # M_t w = v_t, que son los coeficientes [w0, w1, ..., w_{t-1}]
+    coefs, t = mat.resuelve_hankel(S, t0, p, f)
                 
     # Montamos w añadiendo el coeficiente principal: 
     # w(x) = x^{t} -w_{t-1}x^{t-1} - ... - w_0
-    w = Fqx.inv_ad(coefs, p, f) + Fqx.neutro_mult(p, f)
+    w = [Fq.inv_ad(c, p, f) for c in coefs] + Fqx.neutro_mult(p, f)
     
-    # Hallamos las raíces de w(x) que son los beta_{i}
-    betas = []
-    if (Fqx.evalua(w, Fq.neutro_mult(p, f), p, f) == Fqx.neutro_ad(p, f)):
-        betas.append(0)
-    beta = 1
-    candidato = Fq.neutro_mult(p, f)
-    while beta<n:
-        candidato = Fq.mult(candidato, alpha, p, f)
-        if (Fqx.evalua(w, candidato, p, f) == Fqx.neutro_ad(p, f)):
-            betas.append(beta)
-        beta += 1
+    return w, t
+
+def localizador_bm(k, n, alpha, i, r, p, f, S=None):
+    """
+
+    Parámetros
+    ----------
+    k : ENTERO
+        DIMENSIÓN DEL CÓDIGO BCH
+    n : ENTERO
+        LONGITUD DEL CÓDIGO BCH
+    alpha : LISTA
+        GENERADOR DE Fq*
+    i : ENTERO
+        POTENCIA
+    r : LISTA
+        POLINOMIO RECIBIDO POR EL CANAL CON RUIDO
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+    S : LISTA, OPCIONAL
+        LOS 2t SÍNDROMES DE r(x), SI YA SE HAN CALCULADO
+
+    Devuelve
+    --------
+    w : LISTA
+        POLINOMIO LOCALIZADOR MÓNICO CUYAS RAÍCES SON LAS alpha^{beta} 
+        DE LAS POSICIONES beta DE LOS ERRORES, OBTENIDO COMO EL 
+        RECÍPROCO DEL POLINOMIO DE BERLEKAMP-MASSEY DE LOS SÍNDROMES
+    t : ENTERO
+        NÚMERO DE ERRORES OCURRIDOS
+
+    """
+    
+    # Calculamos los 2t síndromes y aplicamos Berlekamp-Massey
+    if S is None:
+        t0 = (n-k)//2
+        S = calcula_sindromes(alpha, i, r, 2*t0, p, f)
+    lam, t = Fqx.berlekamp_massey(S, p, f)
+    
+    # w(x) es el recíproco de lambda(x): w(x) = x^t lambda(1/x)
+    lam = lam + [Fq.neutro_ad(p, f)]*(t+1-len(lam))
+    w = lam[t::-1]
+    
+    return w, t
+
+def magnitudes_sistema(alpha, i, r, t, betas, p, f, S=None):
+    """
+
+    Parámetros
+    ----------
+    alpha : LISTA
+        GENERADOR DE Fq*
+    i : ENTERO
+        POTENCIA
+    r : LISTA
+        POLINOMIO RECIBIDO POR EL CANAL CON RUIDO
+    t : ENTERO
+        NÚMERO DE ERRORES OCURRIDOS
+    betas : LISTA
+        POSICIONES DE LOS ERRORES (RAÍCES alpha^{beta} DE w(x))
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+    S : LISTA, OPCIONAL
+        LOS 2t SÍNDROMES DE r(x), SI YA SE HAN CALCULADO
+
+    Devuelve
+    --------
+    e_coefs : LISTA
+        VALORES DEL POLINOMIO ERROR EN LAS POSICIONES DE betas, OBTENIDOS 
+        POR ELIMINACIÓN GAUSSIANA
+
+    """
     
     # Hallamos el vector del sistema para calcular el polinomio error
     alpha_i = Fq.potencia(alpha, i, p, f)
-    aux = alpha_i
-    r_alpha = [Fqx.evalua(r, alpha_i, p, f)]
-    for j in range(t-1):
-        aux = Fq.mult(aux, alpha, p, f)
-        r_alpha.append(Fqx.evalua(r, aux, p, f))
+    if S is None:
+        r_alpha = calcula_sindromes(alpha, i, r, max(t, 1), p, f)
+    else:
+        r_alpha = S[:max(t, 1)]
 
     # Hallamos la matriz del sistema para calcular el polinomio error
     aux2 = []
@@ -146,29 +296,270 @@ def rs_bch(k, n, alpha, i, g, r, p, f):
             col.append(e1)
         aux2.append(col)
     
-    # Hacemos la eliminación gaussiana
-    B = mat.eliminacion_gaussiana(aux2 + [r_alpha], p, f)
-    new_B = B[:t]
-    new_r = B[len(B)-1]
+    # Resolvemos el sistema con la factorización LU de su matriz; 
+    # si es incompatible no se corrige ningún valor
+    F = mat.lu(aux2, p, f)
+    e_coefs = mat.resuelve(F, r_alpha, p, f)
+    if e_coefs is None:
+        e_coefs = [Fq.neutro_ad(p, f)]*len(betas)
     
-    # Obtenemos el polinomio e
-    e_coefs = deepcopy(new_r)
-    for j in range(0, len(new_B)):
-        for s in range(0, len(new_B[0])):
-            if new_B[j][s] == Fq.neutro_mult(p, f):
-                e_coefs[s] = new_r[j]
-    if len(betas) == 0:
-        e = Fqx.neutro_ad(p, f)
-    else:
-        e = [Fq.neutro_ad(p, f)]*(betas[len(betas)-1]+1)
-        for k in range(len(betas)):
-            e[betas[k]] = e_coefs[k]
+    return e_coefs
+
+def magnitudes_forney(alpha, i, r, w, t, betas, p, f, S=None):
+    """
+
+    Parámetros
+    ----------
+    alpha : LISTA
+        GENERADOR DE Fq*
+    i : ENTERO
+        POTENCIA
+    r : LISTA
+        POLINOMIO RECIBIDO POR EL CANAL CON RUIDO
+    w : LISTA
+        POLINOMIO LOCALIZADOR
+    t : ENTERO
+        NÚMERO DE ERRORES OCURRIDOS
+    betas : LISTA
+        POSICIONES DE LOS ERRORES (RAÍCES alpha^{beta} DE w(x))
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+    S : LISTA, OPCIONAL
+        LOS 2t SÍNDROMES DE r(x), SI YA SE HAN CALCULADO
+
+    Devuelve
+    --------
+    e_coefs : LISTA
+        VALORES DEL POLINOMIO ERROR EN LAS POSICIONES DE betas, OBTENIDOS 
+        CON LA FÓRMULA DE FORNEY
+
+    """
     
-    #Recuperamos c y, con él, recuperamos s
-    c = Fqx.suma(r, Fqx.inv_ad(e, p, f), p, f)
-    s = Fqx.div(c, g, p, f)[0]
+    # Lambda(x) = prod(1 - X_j x) es el recíproco de w(x) 
+    w = w + [Fq.neutro_ad(p, f)]*(t+1-len(w))
+    lam = Fqx.reduce(w[t::-1], p, f)
+    d_lam = Fqx.derivada(lam, p, f)
     
-    return s
+    # Polinomio evaluador Omega(x) = S(x)Lambda(x) (mod x^t)
+    if S is None:
+        S = calcula_sindromes(alpha, i, r, t, p, f)
+    S = Fqx.reduce(list(S[:t]), p, f)
+    omega = Fqx.reduce(Fqx.mult(S, lam, p, f)[:t], p, f)
+    
+    # Y_j = -X_j^{1-i} Omega(X_j^{-1}) / Lambda'(X_j^{-1})
+    e_coefs = []
+    for b in betas:
+        x_inv = Fq.potencia(alpha, -b, p, f)
+        num = Fq.mult(Fq.potencia(x_inv, i-1, p, f), \
+        Fqx.evalua(omega, x_inv, p, f), p, f)
+        den = Fq.inv_mult(Fqx.evalua(d_lam, x_inv, p, f), p, f)
+        e_coefs.append(Fq.inv_ad(Fq.mult(num, den, p, f), p, f))
+    
+    return e_coefs
+
+def localiza_raices(w, alpha, n, p, f):
+    """
+
+    Parámetros
+    ----------
+    w : LISTA
+        POLINOMIO LOCALIZADOR
+    alpha : LISTA
+        GENERADOR DE Fq*
+    n : ENTERO
+        LONGITUD DEL CÓDIGO BCH
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    betas : LISTA
+        EXPONENTES 0 <= beta < n, EN ORDEN CRECIENTE, TALES QUE 
+        w(alpha^beta) = 0. SI deg(w) <= rfq.GRADO_MAX SE CALCULAN LAS 
+        RAÍCES DE FORMA DIRECTA Y SE PASAN A EXPONENTES CON EL 
+        LOGARITMO EN BASE alpha; SI NO, SE USA LA BÚSQUEDA DE CHIEN
+
+    """
+    if len(w)-1 <= rfq.GRADO_MAX:
+        raices = rfq.raices(w, p, f)
+        if raices is not None:
+            betas = []
+            for x in raices:
+                beta = Fq.logaritmo(x, alpha, p, f)
+                if beta is not None and beta<n:
+                    betas.append(beta)
+            return sorted(betas)
+    return chien(w, alpha, n, p, f)
+
+def chien(w, alpha, n, p, f):
+    """
+
+    Parámetros
+    ----------
+    w : LISTA
+        POLINOMIO LOCALIZADOR
+    alpha : LISTA
+        GENERADOR DE Fq*
+    n : ENTERO
+        LONGITUD DEL CÓDIGO BCH
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    betas : LISTA
+        EXPONENTES 0 <= beta < n, EN ORDEN CRECIENTE, TALES QUE 
+        w(alpha^beta) = 0. LA BÚSQUEDA TERMINA EN CUANTO SE HAN 
+        ENCONTRADO deg(w) RAÍCES
+
+    """
+    grado = len(w)-1
+    betas = []
+    tab = Fq.tablas(p, f)
+    if tab is not None:
+        # Registros en el dominio logarítmico: el término j-ésimo 
+        # w_j alpha^{j beta} se actualiza sumando j*log(alpha)
+        exp, log = tab[0], tab[1]
+        orden = len(exp)
+        paso = log[Fq.a_entero(alpha, p, f)]
+        regs = []
+        pasos = []
+        for j in range(len(w)):
+            x = Fq.a_entero(w[j], p, f)
+            if x != 0:
+                regs.append(log[x])
+                pasos.append((j*paso) % orden)
+        beta = 0
+        while beta<n and len(betas)<grado:
+            v = 0
+            for m in range(len(regs)):
+                v = FqE.suma(v, exp[regs[m]], p, f)
+                regs[m] = (regs[m] + pasos[m]) % orden
+            if v == 0:
+                betas.append(beta)
+            beta += 1
+        return betas
+    # Sin tablas, cada registro se multiplica por la constante alpha^j
+    regs = list(w)
+    pasos = [Fq.potencia(alpha, j, p, f) for j in range(len(w))]
+    beta = 0
+    while beta<n and len(betas)<grado:
+        v = Fq.neutro_ad(p, f)
+        for j in range(len(regs)):
+            v = Fq.suma(v, regs[j], p, f)
+            regs[j] = Fq.mult(regs[j], pasos[j], p, f)
+        if v == Fq.neutro_ad(p, f):
+            betas.append(beta)
+        beta += 1
+    return betas
+
+def calcula_sindromes(alpha, i, r, m, p, f):
+    """
+
+    Parámetros
+    ----------
+    alpha : LISTA
+        GENERADOR DE Fq*
+    i : ENTERO
+        POTENCIA
+    r : LISTA
+        POLINOMIO RECIBIDO POR EL CANAL CON RUIDO
+    m : ENTERO
+        NÚMERO DE SÍNDROMES
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    S : LISTA
+        SÍNDROMES S_j = r(alpha^{i+j}) PARA j = 0, 1, ..., m-1
+
+    """
+    S = []
+    alpha_i = Fq.potencia(alpha, i, p, f)
+    for j in range(m):
+        S.append(Fqx.evalua(r, alpha_i, p, f))
+        alpha_i = Fq.mult(alpha_i, alpha, p, f)
+    return S
+
+def calcula_sindromes_bloques(R, alpha, i, m, p, f):
+    """
+
+    Parámetros
+    ----------
+    R : LISTA
+        LISTA DE POLINOMIOS RECIBIDOS POR EL CANAL CON RUIDO
+    alpha : LISTA
+        GENERADOR DE Fq*
+    i : ENTERO
+        POTENCIA
+    m : ENTERO
+        NÚMERO DE SÍNDROMES DE CADA BLOQUE
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+
+    Devuelve
+    --------
+    LISTA
+        PARA CADA r(x) DE R, SUS SÍNDROMES S_j = r(alpha^{i+j}) CON 
+        j = 0, 1, ..., m-1, CALCULADOS A LA VEZ PARA TODOS LOS BLOQUES 
+        COMO EL PRODUCTO DE LA MATRIZ DE LOS BLOQUES (CODIFICADOS COMO 
+        ENTEROS) POR LA MATRIZ DE POTENCIAS alpha^{(i+j)l}
+
+    """
+    tab = Fq.tablas(p, f)
+    if tab is None:
+        return [calcula_sindromes(alpha, i, r, m, p, f) for r in R]
+    exp, log, elementos = tab
+    orden = len(exp)
+    n = max([len(r) for r in R] + [0])
+    la = log[Fq.a_entero(alpha, p, f)]
+    
+    # Matriz de potencias en el dominio logarítmico: E[l][j] = (i+j)*l*la
+    clave = (orden, la, i, n, m)
+    if clave not in _potencias_sindromes:
+        _potencias_sindromes[clave] = \
+        [[((i+j)*l*la) % orden for j in range(m)] for l in range(n)]
+    E = _potencias_sindromes[clave]
+    
+    # Logaritmos de los símbolos recibidos (None para los nulos)
+    L = []
+    for r in R:
+        fila = [log[Fq.a_entero(c, p, f)] for c in r]
+        L.append(fila + [None]*(n-len(fila)))
+    
+    if np is not None and p == 2 and len(R) > 0 and n > 0:
+        # Suma en característica 2 = XOR de las máscaras de bits
+        logs = np.array([[-1 if x is None else x for x in fila] \
+        for fila in L], dtype=np.int64)
+        nulos = logs < 0
+        idx = (logs[:, :, None] + np.array(E, dtype=np.int64)[None, :, :]) \
+        % orden
+        valores = np.array(exp, dtype=np.int64)[idx]
+        valores[nulos] = 0
+        enteros = np.bitwise_xor.reduce(valores, axis=1).tolist()
+    else:
+        enteros = []
+        for fila in L:
+            S = [0]*m
+            for l in range(n):
+                if fila[l] is None:
+                    continue
+                for j in range(m):
+                    S[j] = FqE.suma(S[j], exp[(fila[l] + E[l][j]) % orden], \
+                    p, f)
+            enteros.append(S)
+    return [[list(elementos[x]) for x in S] for S in enteros]
 
 def calcula_g(k, n, alpha, i, p, f):
     """
@@ -8,7 +8,7 @@ import anilloFqx as Fqx
 import matricesFq as mat
 from math import ceil 
 
-def rs_algebra_lineal(n, k, a, y, p, f):
+def rs_algebra_lineal(n, k, a, y, p, f, plan=None):
     """
 
     Parámetros
@@ -26,6 +26,12 @@ def rs_algebra_lineal(n, k, a, y, p, f):
         DE LOS a_i EN s(x)
     p : ENTERO
         PRIMO
+    f : LISTA
+        POLINOMIO
+    plan : DICCIONARIO, OPCIONAL
+        PLAN DE INTERPOLACIÓN DE LOS PUNTOS a, CONSTRUIDO UNA SOLA 
+        VEZ CON Fqx.plan_interpolacion Y REUTILIZADO EN TODOS LOS 
+        BLOQUES QUE COMPARTEN LOS MISMOS PUNTOS
 
     Devuelve
     --------
@@ -42,12 +48,14 @@ def rs_algebra_lineal(n, k, a, y, p, f):
     deg_e = t
     deg_h = t-1 
     
-    # Calculamos el polinomio de interpolación de Lagrange
-    g = Fqx.interpola_lagrange(n, a, y, p, f)
+    # Calculamos el polinomio de interpolación de Lagrange 
+    # y el polinomio w(x)
+    g, w = interpola_y_w(a, y, p, f, plan)
     deg_g = len(g)-1  
     
-    # Calculamos el polinomio w(x)
-    w = calcula_w(a, p, f)
+    # Si deg(g) < k, los valores recibidos no tienen errores
+    if deg_g < k:
+        return g
     deg_w = len(w)-1
     
     # Construimos la matriz del sistema lineal homogéneo
@@ -70,27 +78,11 @@ def rs_algebra_lineal(n, k, a, y, p, f):
             col.pop(len(col)-1)
         sist[j] = col[-ec:]
         
-    # Aplicamos la eliminación Gaussiana de la matriz del sistema
-    A = mat.eliminacion_gaussiana(sist, p, f)
-    
-    # Obtenemos una solución del sistema
-    coefs = Fqx.neutro_mult(p, f)*(deg_e + deg_h + 2)
-    i = 0
-    while i<ec:
-        c = Fq.neutro_ad(p, f)
-        encontrado = False
-        pos = 0
-        j = 0
-        while j<(deg_e + deg_h + 2):
-            if encontrado:
-                c = Fq.suma(c,Fq.inv_ad(A[j][i], p, f), p, f)
-            if A[j][i] == Fq.neutro_mult(p, f) and not encontrado:
-                encontrado = True
-                pos = j
-            j += 1
-        if encontrado:
-            coefs[pos] = c
-        i += 1
+    # Factorizamos la matriz del sistema y obtenemos una solución 
+    # dando el valor 1 a las variables libres
+    F = mat.lu(sist, p, f)
+    coefs = mat.resuelve(F, [Fq.neutro_ad(p, f)]*ec, p, f, \
+    Fq.neutro_mult(p, f))
     e = Fqx.reduce(coefs[:deg_e+1], p, f)
     h = Fqx.reduce(coefs[-deg_h-1:], p, f)
     
@@ -102,7 +94,7 @@ def rs_algebra_lineal(n, k, a, y, p, f):
     
     return s
 
-def rs_gcd_ext_euclideo(n, k, a, y, p, f):
+def rs_gcd_ext_euclideo(n, k, a, y, p, f, plan=None):
     """
 
     Parámetros
@@ -120,6 +112,12 @@ def rs_gcd_ext_euclideo(n, k, a, y, p, f):
         DE LOS a_i EN s(x)
     p : ENTERO
         PRIMO
+    f : LISTA
+        POLINOMIO
+    plan : DICCIONARIO, OPCIONAL
+        PLAN DE INTERPOLACIÓN DE LOS PUNTOS a, CONSTRUIDO UNA SOLA 
+        VEZ CON Fqx.plan_interpolacion Y REUTILIZADO EN TODOS LOS 
+        BLOQUES QUE COMPARTEN LOS MISMOS PUNTOS
 
     Devuelve
     --------
@@ -132,37 +130,17 @@ def rs_gcd_ext_euclideo(n, k, a, y, p, f):
     # Grado del polinomio u(x) buscado
     deg_u = k + ((n-k+1)//2)-1
     
-    # Calculamos el polinomio de interpolación de Lagrange
-    g = Fqx.interpola_lagrange(n, a, y, p, f)
+    # Calculamos el polinomio de interpolación de Lagrange 
+    # y el polinomio w(x)
+    g, w = interpola_y_w(a, y, p, f, plan)
     
-    # Calculamos el polinomio w(x)
-    w = calcula_w(a, p, f)
+    # Si deg(g) < k, los valores recibidos no tienen errores
+    if len(g)-1 < k:
+        return g
     
-    # Inicialización del algoritmo
-    h0 = Fqx.neutro_mult(p, f)
-    e0 = Fqx.neutro_ad(p, f)
-    h1 = Fqx.neutro_ad(p, f)
-    e1 = Fqx.neutro_mult(p, f)
-    u0 = w
-    u1 = g
-    
-    # Bucle principal
-    while (len(u1)-1) > deg_u:
-        
-        cociente, resto = Fqx.div(u0, u1, p, f)
-        
-        u0 = u1
-        u1 = resto 
-        
-        aux_h = \
-        Fqx.suma(h0, Fqx.inv_ad(Fqx.mult(cociente, h1, p, f), p, f), p, f)
-        h0 = h1
-        h1 = aux_h
-        
-        aux_e = \
-        Fqx.suma(e0, Fqx.inv_ad(Fqx.mult(cociente, e1, p, f), p, f), p, f)
-        e0 = e1
-        e1 = aux_e 
+    # Algoritmo de Euclides extendido sobre w(x) y g(x), detenido en 
+    # el primer resto u1 con deg(u1) <= deg_u: u1 = h1*w + e1*g
+    u1, h1, e1 = Fqx.gcd_ext_parcial(w, g, deg_u, p, f)
     
     # Cuando termina el bucle, se recupera s(x)    
     s = Fqx.div(u1, e1, p, f)[0] 
@@ -187,10 +165,37 @@ def calcula_w(a, p, f):
         POLINOMIO PRODUCTO DE TODOS LOS TÉRMINOS DE LA FORMA (x-a_i)
 
     """
-    w = Fqx.neutro_mult(p, f)
-    
-    for i in range(len(a)):
-        p_i = [Fq.inv_ad(a[i], p, f), Fq.neutro_mult(p, f)]
-        w = Fqx.mult(w, p_i, p, f)
+    # w(x) es la raíz del árbol de subproductos de los puntos, 
+    # el mismo que usa Fqx.interpola
+    arbol = Fqx.arbol_subproductos(a, p, f)
+    w = list(arbol[len(arbol)-1][0])
         
-    return w  
\ No newline at end of file
+    return w  
+
+def interpola_y_w(a, y, p, f, plan=None):
+    """
+
+    Parámetros
+    ----------
+    a : LISTA
+        CONTIENE LOS PUNTOS DE EVALUACIÓN a_1, a_2, ..., a_n
+    y : LISTA
+        CONTIENE LOS VALORES RECIBIDOS EN LOS PUNTOS a_i
+    p : ENTERO
+        PRIMO
+    f : LISTA
+        POLINOMIO
+    plan : DICCIONARIO, OPCIONAL
+        PLAN DE INTERPOLACIÓN DE LOS PUNTOS a
+
+    Devuelve
+    --------
+    g : LISTA
+        POLINOMIO DE INTERPOLACIÓN DE LAGRANGE DE LOS PUNTOS (a_i, y_i)
+    w : LISTA
+        POLINOMIO PRODUCTO DE TODOS LOS TÉRMINOS DE LA FORMA (x-a_i)
+
+    """
+    if plan is None:
+        return Fqx.interpola(a, y, p, f), calcula_w(a, p, f)
+    return Fqx.interpola_con_plan(plan, y, p, f), list(plan["w"])
\ No newline at end of file